@@ -2,26 +2,66 @@
 RFC to Markdown Converter Library
 
 This package contains modules for converting RFC XML and HTML documents to Markdown format.
+
+Submodules are imported lazily on first attribute access (PEP 562), so a CLI run that
+only needs one code path does not pay for importing the others.
 """
 
-from .converter import XmlToMdConverter
-from .downloader import download_rfc, download_rfc_html, download_rfc_recursive
-from .html_converter import HtmlToMdConverter
-from .utils import (
-    build_index_file,
-    extract_rfc_numbers_from_markdown,
-    normalize_rfc_number,
-    setup_logging,
-)
-
-__all__ = [
-    "XmlToMdConverter",
-    "HtmlToMdConverter",
-    "download_rfc",
-    "download_rfc_html",
-    "download_rfc_recursive",
-    "normalize_rfc_number",
-    "setup_logging",
-    "build_index_file",
-    "extract_rfc_numbers_from_markdown",
-]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # Real imports for type checkers; __all__ is derived from _LAZY below
+    from .converter import XmlToMdConverter  # noqa: F401
+    from .downloader import (  # noqa: F401
+        download_rfc,
+        download_rfc_html,
+        download_rfc_recursive,
+    )
+    from .html_converter import HtmlToMdConverter  # noqa: F401
+    from .utils import (  # noqa: F401
+        build_index_file,
+        extract_rfc_numbers_from_markdown,
+        normalize_rfc_number,
+        setup_logging,
+    )
+
+# Mapping from public name to (submodule, attribute); also the source of __all__
+_LAZY = {
+    "XmlToMdConverter": (".converter", "XmlToMdConverter"),
+    "HtmlToMdConverter": (".html_converter", "HtmlToMdConverter"),
+    "download_rfc": (".downloader", "download_rfc"),
+    "download_rfc_html": (".downloader", "download_rfc_html"),
+    "download_rfc_recursive": (".downloader", "download_rfc_recursive"),
+    "normalize_rfc_number": (".utils", "normalize_rfc_number"),
+    "setup_logging": (".utils", "setup_logging"),
+    "build_index_file": (".utils", "build_index_file"),
+    "extract_rfc_numbers_from_markdown": (".utils", "extract_rfc_numbers_from_markdown"),
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the submodule providing a public name on first access and cache it.
+
+    Args:
+        name: Attribute name requested from the package
+
+    Returns:
+        The resolved attribute
+    """
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    obj = getattr(importlib.import_module(module_name, __name__), attr)
+    # Cache in the module dict so later lookups never reach __getattr__ again
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    """Return the public names of the package, including not-yet-loaded ones."""
+    return sorted(set(globals()) | set(__all__))
@@ -7,10 +7,129 @@ to well-formatted Markdown.
 
 import logging
 import re
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
+from typing import ClassVar
 
 from lxml import etree
 
+from lib.utils import XML_PARSER_OPTIONS, get_xml_parser
+
+# Precompiled child-step lookups for the hottest findall() call sites
+FIND_SECTIONS = etree.XPath("section")
+FIND_PARAGRAPHS = etree.XPath("t")
+FIND_LIST_ITEMS = etree.XPath("li")
+FIND_REFERENCES = etree.XPath("reference")
+FIND_REFERENCE_GROUPS = etree.XPath("references")
+
+# Table cell lookups, replacing find("thead").find("tr").findall("th") chains
+FIND_HEADER_CELLS = etree.XPath("thead[1]/tr[1]/th")
+FIND_BODY_ROWS = etree.XPath("tbody[1]/tr")
+FIND_DATA_CELLS = etree.XPath("td")
+
+
+def find_first(elem, tag):
+    """
+    Return the first child of an element with the given tag.
+
+    Equivalent to elem.find(tag) for a plain tag name, without parsing a path.
+
+    Args:
+        elem: Parent XML element
+        tag: Child tag name
+
+    Returns:
+        First matching child element, or None
+    """
+    return next(elem.iterchildren(tag), None)
+
+
+# Reference anchors that name an RFC (e.g. "RFC9514", "RFC-8402")
+RFC_ANCHOR_PATTERN = re.compile(r"^RFC[\s-]?(\d+)$", re.IGNORECASE)
+
+# Block elements whose presence makes a <dd> be rendered element by element
+DD_BLOCK_TAGS = ("t", "figure", "ul", "ol", "dl", "artwork", "sourcecode")
+
+# Back section anchors that are rendered as unnumbered sections
+UNNUMBERED_BACK_ANCHORS = frozenset(
+    ("Acknowledgements", "acknowledgements", "Contributors", "contributors", "authors-addresses")
+)
+
+# Postal address elements, in output order
+POSTAL_FIELDS = ("street", "city", "region", "code", "country")
+
+# Root element attributes rendered as document metadata, in output order
+ROOT_METADATA_FIELDS = (
+    ("category", "Category"),
+    ("obsoletes", "Obsoletes"),
+    ("updates", "Updates"),
+    ("submissionType", "Submission Type"),
+    ("consensus", "Consensus"),
+    ("ipr", "IPR"),
+    ("docName", "Doc Name"),
+)
+
+# Markdown header prefixes indexed by depth ("# " to "###### ")
+HEADER_PREFIXES = tuple("#" * level + " " for level in range(7))
+
+# Pre-built indentation strings (two spaces per level) for common nesting depths
+INDENTS = tuple("  " * level for level in range(32))
+
+
+def indentation(level):
+    """
+    Return the indentation string for a nesting level.
+
+    Args:
+        level: Nesting level (two spaces per level)
+
+    Returns:
+        Indentation string, empty for levels below one
+    """
+    if 0 <= level < len(INDENTS):
+        return INDENTS[level]
+    return "  " * level
+
+
+# <date> attributes rendered for the document and for references, in output order
+DATE_FIELDS = ("day", "month", "year")
+REFERENCE_DATE_FIELDS = ("month", "year")
+
+
+def format_date(date_elem, fields=DATE_FIELDS):
+    """
+    Format a <date> element as space-separated non-empty attribute values.
+
+    Args:
+        date_elem: XML date element, or None
+        fields: Attribute names to include, in output order
+
+    Returns:
+        Date string (e.g. "15 May 2024"), empty if there is nothing to show
+    """
+    if date_elem is None:
+        return ""
+    return " ".join(filter(None, map(date_elem.get, fields)))
+
+
+# Characters that must be escaped inside a double-quoted HTML attribute value
+ANCHOR_ESCAPE_TABLE = str.maketrans({"&": "&amp;", '"': "&quot;", "<": "&lt;", ">": "&gt;"})
+
+
+@lru_cache(maxsize=4096)
+def anchor_tag(anchor):
+    """
+    Return the HTML anchor span for an anchor name, escaped and cached.
+
+    Args:
+        anchor: Raw anchor name from the XML
+
+    Returns:
+        '<a name="..."></a>' string
+    """
+    return '<a name="' + anchor.translate(ANCHOR_ESCAPE_TABLE) + '"></a>'
+
 
 class XmlToMdConverter:
     """
@@ -20,6 +139,35 @@ class XmlToMdConverter:
     Markdown, including metadata, sections, and various RFC-specific elements.
     """
 
+    # Fixed instance attributes: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        "_text_cache",
+        "logger",
+        "markdown_lines",
+        "ns",
+        "root",
+        "section_depth",
+        "section_id_to_anchor",
+        "toc_entries",
+        "tree",
+        "xml_file",
+    )
+
+    # Handlers for child elements of a <section>, called as handler(self, child, depth)
+    _SECTION_CHILD_HANDLERS: ClassVar[dict[str, Callable]] = {
+        "t": lambda self, child, depth: self._process_paragraph(child),
+        "ul": lambda self, child, depth: self._process_list(child, ordered=False),
+        "ol": lambda self, child, depth: self._process_list(child, ordered=True),
+        "dl": lambda self, child, depth: self._process_definition_list(child),
+        "figure": lambda self, child, depth: self._process_figure(child),
+        "artwork": lambda self, child, depth: self._process_artwork(child),
+        "sourcecode": lambda self, child, depth: self._process_sourcecode(child),
+        "table": lambda self, child, depth: self._process_table(child),
+        "note": lambda self, child, depth: self._process_note(child),
+        "section": lambda self, child, depth: self._process_section(child, depth + 1),
+    }
+    _SECTION_CHILD_TAGS = tuple(_SECTION_CHILD_HANDLERS)
+
     def __init__(self, xml_file):
         """
         Initialize the converter with an XML file.
@@ -35,6 +183,7 @@ class XmlToMdConverter:
         self.section_depth: int = 0
         self.toc_entries: list[dict] = []  # For TOC generation
         self.section_id_to_anchor: dict[str, str] = {}  # Mapping from section pn to anchor
+        self._text_cache: dict[etree._Element, str] = {}  # Memo for _get_element_text
 
     def _build_section_anchor_mapping(self):
         """
@@ -42,34 +191,16 @@ class XmlToMdConverter:
         This must be called before TOC generation.
         """
         assert self.root is not None, "XML root must be parsed before building anchor mapping"
-        # Process middle sections
-        middle = self.root.find("middle")
-        if middle is not None:
-            for section in middle.findall("section"):
-                self._collect_section_anchors(section)
-
-        # Process back sections
-        back = self.root.find("back")
-        if back is not None:
-            for section in back.findall("section"):
-                self._collect_section_anchors(section)
-
-    def _collect_section_anchors(self, section):
-        """
-        Recursively collect pn to anchor mappings from section tree.
-
-        Args:
-            section: XML section element
-        """
-        pn = section.get("pn", "")
-        anchor = section.get("anchor", "")
-
-        if pn and anchor:
-            self.section_id_to_anchor[pn] = anchor
-
-        # Process nested sections recursively
-        for subsection in section.findall("section"):
-            self._collect_section_anchors(subsection)
+        # Walk every (nested) section of middle and back in one C-level iteration each
+        for part_tag in ("middle", "back"):
+            part = self.root.find(part_tag)
+            if part is None:
+                continue
+            for section in part.iter("section"):
+                pn = section.get("pn")
+                anchor = section.get("anchor")
+                if pn and anchor:
+                    self.section_id_to_anchor[pn] = anchor
 
     def convert(self):
         """
@@ -82,7 +213,7 @@ class XmlToMdConverter:
 
         # Parse XML with namespace handling
         try:
-            self.tree = etree.parse(str(self.xml_file))
+            self.tree = etree.parse(str(self.xml_file), get_xml_parser())
             self.root = self.tree.getroot()
         except etree.XMLSyntaxError as e:
             raise ValueError(f"Invalid XML syntax: {e}") from e
@@ -108,9 +239,148 @@ class XmlToMdConverter:
 
         self._process_middle()
         self._process_back()
+        self._text_cache.clear()
 
         return "\n".join(self.markdown_lines)
 
+    def convert_streaming(self):
+        """
+        Convert the RFC XML to Markdown incrementally, bounding memory use.
+
+        The document is read with etree.iterparse in two passes: the first collects
+        the section pn to anchor mapping needed by the TOC, the second emits Markdown
+        as elements complete and clears each top-level <middle> section once written.
+        Peak memory is therefore bounded by the largest top-level section, including
+        any tables and artwork it contains. Joining the yielded chunks gives the same
+        document as convert().
+
+        Yields:
+            Consecutive chunks of the Markdown document
+        """
+        self.logger.info(f"Stream-parsing XML file: {self.xml_file}")
+
+        try:
+            self._collect_section_anchors_streaming()
+
+            header_done = False
+            context = etree.iterparse(
+                str(self.xml_file),
+                events=("end",),
+                tag=("front", "section", "back"),
+                **XML_PARSER_OPTIONS,
+            )
+            for _event, elem in context:
+                if self.root is None:
+                    self.root = elem.getroottree().getroot()
+                    self.ns = {"rfc": "http://www.w3.org/2001/XInclude"} if self.root.nsmap else {}
+
+                parent = elem.getparent()
+                if elem.tag == "front":
+                    if parent is self.root:
+                        self._process_front()
+                    continue
+
+                if elem.tag == "section":
+                    # Only top-level <middle> sections are emitted (and freed) here
+                    if (
+                        parent is None
+                        or parent.tag != "middle"
+                        or parent.getparent() is not self.root
+                    ):
+                        continue
+                elif parent is not self.root:
+                    continue
+
+                if not header_done:
+                    self.markdown_lines.extend(self._generate_toc())
+                    header_done = True
+
+                if elem.tag == "section":
+                    self._process_section(elem, depth=1)
+                    # Free the finished section and any siblings already written
+                    self._text_cache.clear()
+                    elem.clear(keep_tail=True)
+                    while elem.getprevious() is not None:
+                        del parent[0]
+                else:
+                    self._process_back()
+
+                yield from self._flush_markdown_lines()
+
+            if not header_done:
+                if self.root is None:
+                    # No <front>, <section> or <back> ended, so take the root from the parser
+                    self.root = context.root
+                    self.ns = {"rfc": "http://www.w3.org/2001/XInclude"} if self.root.nsmap else {}
+                self.markdown_lines.extend(self._generate_toc())
+        except etree.XMLSyntaxError as e:
+            raise ValueError(f"Invalid XML syntax: {e}") from e
+        except OSError as e:
+            raise ValueError(f"Error parsing XML: {e}") from e
+
+        self._text_cache.clear()
+        yield "\n".join(self.markdown_lines)
+        self.markdown_lines = []
+
+    def convert_to(self, stream):
+        """
+        Convert the RFC XML to Markdown and write it to a text stream.
+
+        Chunks from convert_streaming() are written as they are produced, so the
+        whole document is never held in memory as a single string.
+
+        Args:
+            stream: Writable text file object (e.g. opened with encoding="utf-8")
+
+        Returns:
+            Number of characters written
+        """
+        written = 0
+        for chunk in self.convert_streaming():
+            written += stream.write(chunk)
+        return written
+
+    def _collect_section_anchors_streaming(self):
+        """
+        Fill the section pn to anchor mapping in a lightweight iterparse pass.
+
+        Only sections under <middle> and <back> are considered, matching
+        _build_section_anchor_mapping.
+        """
+        context = etree.iterparse(
+            str(self.xml_file),
+            events=("start", "end"),
+            tag=("middle", "back", "section"),
+            **XML_PARSER_OPTIONS,
+        )
+        part_depth = 0
+        for event, elem in context:
+            if elem.tag != "section":
+                part_depth += 1 if event == "start" else -1
+            elif event == "start" and part_depth:
+                pn = elem.get("pn")
+                anchor = elem.get("anchor")
+                if pn and anchor:
+                    self.section_id_to_anchor[pn] = anchor
+            if event == "end":
+                elem.clear(keep_tail=True)
+
+    def _flush_markdown_lines(self):
+        """
+        Yield the buffered Markdown lines as one chunk, keeping the last line.
+
+        The last line stays buffered so that _blank_line() still sees it; the
+        chunk therefore ends with the newline that separates it from that line.
+
+        Yields:
+            Buffered Markdown text, if there is more than one buffered line
+        """
+        lines = self.markdown_lines
+        if len(lines) > 1:
+            chunk = "\n".join(lines[:-1]) + "\n"
+            self.markdown_lines = lines[-1:]
+            yield chunk
+
     def _process_front(self):
         """Process the <front> section containing metadata and abstract."""
         assert self.root is not None, "XML root must be parsed before processing front"
@@ -118,18 +388,21 @@ class XmlToMdConverter:
         if front is None:
             return
 
+        # Group front children by tag in a single pass instead of one find() per field
+        children = self._group_children(front)
+
         # Extract title
-        title_elem = front.find("title")
+        title_elem = self._first_child(children, "title")
         if title_elem is not None:
             title = title_elem.text or ""
             abbrev = title_elem.get("abbrev", "")
             self.markdown_lines.append(f"# {title}")
             if abbrev and abbrev != title:
                 self.markdown_lines.append(f"*({abbrev})*")
-            self.markdown_lines.append("")
+            self._blank_line()
 
         # Extract seriesInfo
-        series_info = front.find("seriesInfo")
+        series_info = self._first_child(children, "seriesInfo")
         if series_info is not None:
             rfc_name = series_info.get("name", "")
             rfc_value = series_info.get("value", "")
@@ -138,58 +411,32 @@ class XmlToMdConverter:
                 self.markdown_lines.append(f"**{rfc_name} {rfc_value}**")
                 if stream:
                     self.markdown_lines.append(f"*Stream: {stream}*")
-                self.markdown_lines.append("")
+                self._blank_line()
 
         # Extract document metadata from root element
-        metadata_fields = []
-
-        category = self.root.get("category", "")
-        if category:
-            metadata_fields.append(f"**Category:** {category}")
-
-        obsoletes = self.root.get("obsoletes", "")
-        if obsoletes:
-            metadata_fields.append(f"**Obsoletes:** {obsoletes}")
-
-        updates = self.root.get("updates", "")
-        if updates:
-            metadata_fields.append(f"**Updates:** {updates}")
-
-        submission_type = self.root.get("submissionType", "")
-        if submission_type:
-            metadata_fields.append(f"**Submission Type:** {submission_type}")
-
-        consensus = self.root.get("consensus", "")
-        if consensus:
-            metadata_fields.append(f"**Consensus:** {consensus}")
-
-        ipr = self.root.get("ipr", "")
-        if ipr:
-            metadata_fields.append(f"**IPR:** {ipr}")
-
-        doc_name = self.root.get("docName", "")
-        if doc_name:
-            metadata_fields.append(f"**Doc Name:** {doc_name}")
+        root_attrib = self.root.attrib
+        metadata_fields = [
+            f"**{label}:** {root_attrib[attr]}"
+            for attr, label in ROOT_METADATA_FIELDS
+            if root_attrib.get(attr)
+        ]
 
         # Add metadata fields if any exist
         if metadata_fields:
-            for field in metadata_fields:
-                self.markdown_lines.append(field)
-            self.markdown_lines.append("")
+            self.markdown_lines.extend(metadata_fields)
+            self._blank_line()
 
         # Extract authors
-        authors = front.findall("author")
+        authors = children.get("author", [])
         if authors:
-            self.markdown_lines.append("## Authors")
-            self.markdown_lines.append("")
+            self.markdown_lines.extend(("## Authors", ""))
             for author in authors:
-                fullname = author.get("fullname", "")
-                initials = author.get("initials", "")
-                surname = author.get("surname", "")
-                role = author.get("role", "")
-
-                author_line = fullname or f"{initials} {surname}".strip()
-                if role == "editor":
+                # Only read initials/surname when there is no fullname to show
+                author_line = (
+                    author.get("fullname")
+                    or f"{author.get('initials', '')} {author.get('surname', '')}".strip()
+                )
+                if author.get("role") == "editor":
                     author_line += " *(Editor)*"
                 self.markdown_lines.append(f"- {author_line}")
 
@@ -205,78 +452,93 @@ class XmlToMdConverter:
                     if email is not None and email.text:
                         self.markdown_lines.append(f"  - Email: {email.text}")
 
-            self.markdown_lines.append("")
+            self._blank_line()
 
         # Extract date
-        date_elem = front.find("date")
-        if date_elem is not None:
-            month = date_elem.get("month", "")
-            year = date_elem.get("year", "")
-            day = date_elem.get("day", "")
-
-            date_str = ""
-            if day:
-                date_str = f"{day} "
-            if month:
-                date_str += f"{month} "
-            if year:
-                date_str += year
-
-            if date_str:
-                self.markdown_lines.append(f"**Date:** {date_str.strip()}")
-                self.markdown_lines.append("")
+        date_str = format_date(self._first_child(children, "date"))
+        if date_str:
+            self.markdown_lines.extend((f"**Date:** {date_str}", ""))
 
         # Extract area and workgroup
-        area = front.find("area")
+        area = self._first_child(children, "area")
         if area is not None and area.text:
-            self.markdown_lines.append(f"**Area:** {area.text}")
-            self.markdown_lines.append("")
+            self.markdown_lines.extend((f"**Area:** {area.text}", ""))
 
-        workgroup = front.find("workgroup")
+        workgroup = self._first_child(children, "workgroup")
         if workgroup is not None and workgroup.text:
-            self.markdown_lines.append(f"**Workgroup:** {workgroup.text}")
-            self.markdown_lines.append("")
+            self.markdown_lines.extend((f"**Workgroup:** {workgroup.text}", ""))
 
         # Extract keywords
-        keywords = front.findall("keyword")
+        keywords = children.get("keyword", [])
         if keywords:
             keyword_list = [kw.text for kw in keywords if kw.text]
             if keyword_list:
-                self.markdown_lines.append(f"**Keywords:** {', '.join(keyword_list)}")
-                self.markdown_lines.append("")
+                self.markdown_lines.extend((f"**Keywords:** {', '.join(keyword_list)}", ""))
 
         # Extract links
         links = self.root.findall("link")
         if links:
-            self.markdown_lines.append("## Related Documents")
-            self.markdown_lines.append("")
+            self.markdown_lines.extend(("## Related Documents", ""))
             for link in links:
                 href = link.get("href", "")
                 rel = link.get("rel", "")
                 if href:
                     self.markdown_lines.append(f"- [{rel or 'Link'}]({href})")
-            self.markdown_lines.append("")
+            self._blank_line()
 
         # Extract abstract
-        abstract = front.find("abstract")
+        abstract = self._first_child(children, "abstract")
         if abstract is not None:
-            self.markdown_lines.append("## Abstract")
-            self.markdown_lines.append("")
-            for t_elem in abstract.findall("t"):
-                text = self._get_element_text(t_elem)
-                if text:
-                    indent = t_elem.get("indent", "0")
-                    if indent != "0":
-                        text = "  " * int(indent) + text
-                    self.markdown_lines.append(text)
-                    self.markdown_lines.append("")
+            self.markdown_lines.extend(("## Abstract", ""))
+            for t_elem in FIND_PARAGRAPHS(abstract):
+                self._process_paragraph(t_elem)
 
         # Extract boilerplate sections
-        boilerplate = front.find("boilerplate")
+        boilerplate = self._first_child(children, "boilerplate")
         if boilerplate is not None:
-            for section in boilerplate.findall("section"):
+            for section in FIND_SECTIONS(boilerplate):
                 self._process_boilerplate_section(section)
 
+    def _blank_line(self):
+        """
+        Append an empty separator line unless the output already ends with one.
+
+        Consecutive structural separators (e.g. the end of a nested list followed by
+        the end of its enclosing definition list) collapse into a single empty line.
+        """
+        lines = self.markdown_lines
+        if not lines or lines[-1]:
+            lines.append("")
+
+    def _group_children(self, elem):
+        """
+        Group the direct children of an element by tag in a single pass.
+
+        Args:
+            elem: XML element whose children should be grouped
+
+        Returns:
+            Dictionary mapping tag names to lists of child elements in document order
+        """
+        children: dict[str, list] = {}
+        for child in elem:
+            children.setdefault(child.tag, []).append(child)
+        return children
+
+    def _first_child(self, children, tag):
+        """
+        Return the first child with the given tag from a grouped children mapping.
+
+        Args:
+            children: Mapping returned by _group_children
+            tag: Tag name to look up
+
+        Returns:
+            First matching element, or None if there is none
+        """
+        elems = children.get(tag)
+        return elems[0] if elems else None
+
     def _generate_toc(self):
         """
         Generate Table of Contents from the XML <toc> section or from collected entries.
@@ -311,7 +573,7 @@ class XmlToMdConverter:
                 anchor = entry["anchor"]
                 number = entry.get("number", "")
 
-                indent = "  " * (depth - 1)
+                indent = indentation(depth - 1)
 
                 if number:
                     toc_lines.append(f"{indent}- [{number}. {title}](#{anchor})")
@@ -324,66 +586,77 @@ class XmlToMdConverter:
 
     def _process_toc_list(self, ul_elem, toc_lines, depth=0):
         """
-        Process TOC list recursively from XML.
+        Process TOC list from XML, including nested lists.
+
+        Nested <ul>/<li> lists are walked iteratively with etree.iterwalk, tracking
+        nesting depth from the ul start/end events instead of recursing per list.
 
         Args:
             ul_elem: XML ul element from TOC
             toc_lines: List to append TOC lines to
-            depth: Current nesting depth
+            depth: Nesting depth of ul_elem
         """
-        indent = "  " * depth
-
-        for li in ul_elem.findall("li"):
-            # Get the text content and xref
-            t_elem = li.find("t")
-            if t_elem is not None:
-                xrefs = t_elem.findall("xref")
-                if len(xrefs) >= 2:
-                    # First xref is section number, second is title
-                    num_xref = xrefs[0]
-                    title_xref = xrefs[1]
-
-                    target = num_xref.get("target", "")
-                    section_num = num_xref.get("derivedContent", "")
-                    # Try derivedContent first, then text content
-                    title = title_xref.get("derivedContent", "") or title_xref.text or ""
-
-                    if section_num and title:
-                        toc_lines.append(
-                            f"{indent}- [{section_num}. {title}](#{self.section_id_to_anchor.get(target, target)})"
-                        )
-                    elif title:
-                        toc_lines.append(
-                            f"{indent}- [{title}](#{self.section_id_to_anchor.get(target, target)})"
-                        )
-                elif len(xrefs) == 1:
-                    # Only one xref - could be unnumbered section
-                    xref = xrefs[0]
-                    target = xref.get("target", "")
-                    # Try derivedContent first, then text content
-                    title = xref.get("derivedContent", "") or xref.text or ""
-                    if title:
-                        toc_lines.append(
-                            f"{indent}- [{title}](#{self.section_id_to_anchor.get(target, target)})"
-                        )
+        ul_depth = depth - 1
+        for event, elem in etree.iterwalk(ul_elem, events=("start", "end"), tag=("ul", "li")):
+            if elem.tag == "ul":
+                ul_depth += 1 if event == "start" else -1
+            elif event == "start":
+                self._process_toc_item(elem, toc_lines, indentation(ul_depth))
+
+    def _process_toc_item(self, li, toc_lines, indent):
+        """
+        Append the TOC line for a single <li> entry.
+
+        Args:
+            li: XML li element from TOC
+            toc_lines: List to append TOC lines to
+            indent: Indentation prefix for the entry
+        """
+        # Get the text content and xref
+        t_elem = next(li.iterchildren("t"), None)
+        if t_elem is None:
+            return
 
-            # Process nested lists
-            nested_ul = li.find("ul")
-            if nested_ul is not None:
-                self._process_toc_list(nested_ul, toc_lines, depth + 1)
+        xrefs = list(t_elem.iterchildren("xref"))
+        if len(xrefs) >= 2:
+            # First xref is section number, second is title
+            num_xref = xrefs[0]
+            title_xref = xrefs[1]
+
+            target = num_xref.get("target", "")
+            section_num = num_xref.get("derivedContent", "")
+            # Try derivedContent first, then text content
+            title = title_xref.get("derivedContent", "") or title_xref.text or ""
+
+            if section_num and title:
+                toc_lines.append(
+                    f"{indent}- [{section_num}. {title}](#{self.section_id_to_anchor.get(target, target)})"
+                )
+            elif title:
+                toc_lines.append(
+                    f"{indent}- [{title}](#{self.section_id_to_anchor.get(target, target)})"
+                )
+        elif len(xrefs) == 1:
+            # Only one xref - could be unnumbered section
+            xref = xrefs[0]
+            target = xref.get("target", "")
+            # Try derivedContent first, then text content
+            title = xref.get("derivedContent", "") or xref.text or ""
+            if title:
+                toc_lines.append(
+                    f"{indent}- [{title}](#{self.section_id_to_anchor.get(target, target)})"
+                )
 
     def _process_boilerplate_section(self, section):
         """Process boilerplate sections like Status of This Memo."""
-        name_elem = section.find("name")
+        name_elem = find_first(section, "name")
         if name_elem is not None and name_elem.text:
-            self.markdown_lines.append(f"## {name_elem.text}")
-            self.markdown_lines.append("")
+            self.markdown_lines.extend((f"## {name_elem.text}", ""))
 
-        for t_elem in section.findall("t"):
+        for t_elem in FIND_PARAGRAPHS(section):
             text = self._get_element_text(t_elem)
             if text:
-                self.markdown_lines.append(text)
-                self.markdown_lines.append("")
+                self.markdown_lines.extend((text, ""))
 
     def _process_middle(self):
         """Process the <middle> section containing main content."""
@@ -393,7 +666,7 @@ class XmlToMdConverter:
             return
 
         # Process all sections
-        for section in middle.findall("section"):
+        for section in FIND_SECTIONS(middle):
             self._process_section(section, depth=1)
 
     def _process_back(self):
@@ -415,44 +688,37 @@ class XmlToMdConverter:
         references_parent = back.find("references")
         if references_parent is not None:
             # Single references section with subsections
-            parent_name = references_parent.find("name")
+            parent_name = find_first(references_parent, "name")
             parent_anchor = references_parent.get("anchor", "references")
 
-            self.markdown_lines.append(f'<a name="{parent_anchor}"></a>')
+            self.markdown_lines.append(anchor_tag(parent_anchor))
             if parent_name is not None and parent_name.text:
                 self.markdown_lines.append(f"# {parent_name.text}")
             else:
                 self.markdown_lines.append("# References")
-            self.markdown_lines.append("")
+            self._blank_line()
 
             # Process subsections (Normative/Informative)
-            for ref_section in references_parent.findall("references"):
-                name_elem = ref_section.find("name")
+            for ref_section in FIND_REFERENCE_GROUPS(references_parent):
+                name_elem = find_first(ref_section, "name")
                 if name_elem is not None and name_elem.text:
                     anchor = ref_section.get("anchor", "")
                     if anchor:
-                        self.markdown_lines.append(f'<a name="{anchor}"></a>')
-                    self.markdown_lines.append(f"## {name_elem.text}")
-                    self.markdown_lines.append("")
+                        self.markdown_lines.append(anchor_tag(anchor))
+                    self.markdown_lines.extend((f"## {name_elem.text}", ""))
 
                 # Process individual references
-                for reference in ref_section.findall("reference"):
+                for reference in FIND_REFERENCES(ref_section):
                     self._process_reference(reference, display_refs)
 
         # Process appendices and other sections in back
-        for section in back.findall("section"):
+        for section in FIND_SECTIONS(back):
             # Check if it's a special section (Acknowledgements, Contributors, Authors' Addresses)
             anchor = section.get("anchor", "")
             numbered = section.get("numbered", "true")
 
             # These sections are typically unnumbered
-            if numbered == "false" or anchor in [
-                "Acknowledgements",
-                "acknowledgements",
-                "Contributors",
-                "contributors",
-                "authors-addresses",
-            ]:
+            if numbered == "false" or anchor in UNNUMBERED_BACK_ANCHORS:
                 self._process_unnumbered_section(section)
             else:
                 self._process_section(section, depth=1)
@@ -465,25 +731,23 @@ class XmlToMdConverter:
             section: XML section element
         """
         # Extract section name
-        name_elem = section.find("name")
+        name_elem = find_first(section, "name")
         if name_elem is not None and name_elem.text:
             anchor = section.get("anchor", "")
 
             # Add anchor if present
             if anchor:
-                self.markdown_lines.append(f'<a name="{anchor}"></a>')
+                self.markdown_lines.append(anchor_tag(anchor))
 
-            self.markdown_lines.append(f"# {name_elem.text}")
-            self.markdown_lines.append("")
+            self.markdown_lines.extend((f"# {name_elem.text}", ""))
 
         # Process content - could be paragraphs, contacts, authors, etc.
-        for child in section:
+        for child in section.iterchildren("t", "contact", "author"):
             if child.tag == "t":
                 # Paragraph
                 text = self._get_element_text(child)
                 if text:
-                    self.markdown_lines.append(text)
-                    self.markdown_lines.append("")
+                    self.markdown_lines.extend((text, ""))
             elif child.tag == "contact":
                 # Contact information (for Contributors)
                 self._process_contact(child)
@@ -498,58 +762,20 @@ class XmlToMdConverter:
         Args:
             author_elem: XML author element
         """
-        fullname = author_elem.get("fullname", "")
-        initials = author_elem.get("initials", "")
-        surname = author_elem.get("surname", "")
-
-        # Display name
+        # Display name; initials/surname are only read when fullname is absent
+        fullname = author_elem.get("fullname")
         if fullname:
             self.markdown_lines.append(f"**{fullname}**")
-        elif initials and surname:
-            self.markdown_lines.append(f"**{initials} {surname}**")
-        elif surname:
-            self.markdown_lines.append(f"**{surname}**")
-
-        self.markdown_lines.append("")
-
-        # Organization
-        org = author_elem.find("organization")
-        if org is not None and org.text:
-            self.markdown_lines.append(f"- Organization: {org.text}")
-
-        # Address
-        address = author_elem.find("address")
-        if address is not None:
-            # Postal address
-            postal = address.find("postal")
-            if postal is not None:
-                street = postal.find("street")
-                city = postal.find("city")
-                region = postal.find("region")
-                code = postal.find("code")
-                country = postal.find("country")
-
-                address_parts = []
-                if street is not None and street.text:
-                    address_parts.append(street.text)
-                if city is not None and city.text:
-                    address_parts.append(city.text)
-                if region is not None and region.text:
-                    address_parts.append(region.text)
-                if code is not None and code.text:
-                    address_parts.append(code.text)
-                if country is not None and country.text:
-                    address_parts.append(country.text)
-
-                if address_parts:
-                    self.markdown_lines.append(f"- Address: {', '.join(address_parts)}")
-
-            # Email
-            email = address.find("email")
-            if email is not None and email.text:
-                self.markdown_lines.append(f"- Email: {email.text}")
+        else:
+            surname = author_elem.get("surname")
+            if surname:
+                initials = author_elem.get("initials")
+                self.markdown_lines.append(
+                    f"**{initials} {surname}**" if initials else f"**{surname}**"
+                )
 
-        self.markdown_lines.append("")
+        self._blank_line()
+        self._process_contact_details(author_elem)
 
     def _process_contact(self, contact_elem):
         """
@@ -561,47 +787,58 @@ class XmlToMdConverter:
         fullname = contact_elem.get("fullname", "")
 
         if fullname:
-            self.markdown_lines.append(f"**{fullname}**")
-            self.markdown_lines.append("")
+            self.markdown_lines.extend((f"**{fullname}**", ""))
+
+        self._process_contact_details(contact_elem)
 
+    def _process_contact_details(self, person_elem):
+        """
+        Process organization, postal address and email of an author or contact.
+
+        Args:
+            person_elem: XML author or contact element
+        """
         # Organization
-        org = contact_elem.find("organization")
+        org = person_elem.find("organization")
         if org is not None and org.text:
             self.markdown_lines.append(f"- Organization: {org.text}")
 
         # Address
-        address = contact_elem.find("address")
+        address = person_elem.find("address")
         if address is not None:
             # Postal address
             postal = address.find("postal")
             if postal is not None:
-                street = postal.find("street")
-                city = postal.find("city")
-                region = postal.find("region")
-                code = postal.find("code")
-                country = postal.find("country")
-
-                address_parts = []
-                if street is not None and street.text:
-                    address_parts.append(street.text)
-                if city is not None and city.text:
-                    address_parts.append(city.text)
-                if region is not None and region.text:
-                    address_parts.append(region.text)
-                if code is not None and code.text:
-                    address_parts.append(code.text)
-                if country is not None and country.text:
-                    address_parts.append(country.text)
-
-                if address_parts:
-                    self.markdown_lines.append(f"- Address: {', '.join(address_parts)}")
+                postal_text = self._format_postal(postal)
+                if postal_text:
+                    self.markdown_lines.append(f"- Address: {postal_text}")
 
             # Email
             email = address.find("email")
             if email is not None and email.text:
                 self.markdown_lines.append(f"- Email: {email.text}")
 
-        self.markdown_lines.append("")
+        self._blank_line()
+
+    def _format_postal(self, postal):
+        """
+        Format a postal address as a comma-separated string.
+
+        Children are scanned once; the first non-empty element of each kind is used,
+        in street, city, region, code, country order.
+
+        Args:
+            postal: XML postal element
+
+        Returns:
+            Formatted address string (empty if no parts are present)
+        """
+        parts = dict.fromkeys(POSTAL_FIELDS, "")
+        for child in postal:
+            tag = child.tag
+            if tag in parts and not parts[tag] and child.text:
+                parts[tag] = child.text
+        return ", ".join(part for part in parts.values() if part)
 
     def _process_reference(self, reference, display_refs):
         """
@@ -611,93 +848,92 @@ class XmlToMdConverter:
             reference: XML reference element
             display_refs: Dictionary mapping reference anchors to display names
         """
+        # Extract reference information
+        ref_children = self._group_children(reference)
+        front = self._first_child(ref_children, "front")
+        if front is None:
+            return
+
+        # Combine all parts
+        ref_text = " ".join(self._reference_fragments(reference, ref_children, front, display_refs))
+        self.markdown_lines.append(ref_text)
+        self._blank_line()
+
+    def _reference_fragments(self, reference, ref_children, front, display_refs):
+        """
+        Generate the space-separated fragments of a reference entry.
+
+        Args:
+            reference: XML reference element
+            ref_children: Children of the reference grouped by tag
+            front: The reference's front element
+            display_refs: Dictionary mapping reference anchors to display names
+
+        Yields:
+            Reference fragments in output order
+        """
         anchor = reference.get("anchor", "")
         target = reference.get("target", "")
 
         # Use display reference if available
         ref_id = display_refs.get(anchor, anchor)
-
-        # Extract reference information
-        front = reference.find("front")
-        if front is None:
-            return
-
-        ref_parts = []
+        front_children = self._group_children(front)
 
         # Add reference ID
         if ref_id:
-            ref_parts.append(f'<a name="{anchor}"></a>')
-            ref_parts.append(f"**[{ref_id}]**")
+            yield anchor_tag(anchor)
+            yield f"**[{ref_id}]**"
 
         # Extract authors
-        authors = front.findall("author")
         author_names = []
-        for author in authors:
-            initials = author.get("initials", "")
-            surname = author.get("surname", "")
-            fullname = author.get("fullname", "")
-
+        for author in front_children.get("author", []):
+            surname = author.get("surname")
             if surname:
-                if initials:
-                    author_names.append(f"{initials} {surname}")
-                else:
-                    author_names.append(surname)
-            elif fullname:
-                author_names.append(fullname)
+                initials = author.get("initials")
+                author_names.append(f"{initials} {surname}" if initials else surname)
+            else:
+                fullname = author.get("fullname")
+                if fullname:
+                    author_names.append(fullname)
 
         if author_names:
-            ref_parts.append(", ".join(author_names) + ",")
+            yield ", ".join(author_names) + ","
 
         # Extract title
-        title_elem = front.find("title")
+        title_elem = self._first_child(front_children, "title")
         if title_elem is not None and title_elem.text:
-            ref_parts.append(f'"{title_elem.text}",')
+            yield f'"{title_elem.text}",'
 
         # Extract seriesInfo
-        series_infos = reference.findall("seriesInfo")
         series_parts = []
-        for series in series_infos:
+        for series in ref_children.get("seriesInfo", []):
             name = series.get("name", "")
             value = series.get("value", "")
             if name and value:
                 series_parts.append(f"{name} {value}")
 
         if series_parts:
-            ref_parts.append(", ".join(series_parts) + ",")
+            yield ", ".join(series_parts) + ","
 
         # Extract date
-        date_elem = front.find("date")
-        if date_elem is not None:
-            month = date_elem.get("month", "")
-            year = date_elem.get("year", "")
-            date_str = ""
-            if month:
-                date_str = f"{month} "
-            if year:
-                date_str += year
-            if date_str:
-                ref_parts.append(date_str + ".")
+        date_str = format_date(self._first_child(front_children, "date"), REFERENCE_DATE_FIELDS)
+        if date_str:
+            yield date_str + "."
 
         # Extract refcontent (additional info like "Work in Progress")
-        refcontent = reference.find("refcontent")
+        refcontent = self._first_child(ref_children, "refcontent")
         if refcontent is not None and refcontent.text:
-            ref_parts.append(refcontent.text)
+            yield refcontent.text
 
         # Add target URL if available
         if target:
-            ref_parts.append(f"<{target}>")
+            yield f"<{target}>"
 
         # Add local MD link if this is an RFC reference
         if anchor:
-            rfc_match = re.match(r"^RFC[\s-]?(\d+)$", anchor, re.IGNORECASE)
+            rfc_match = RFC_ANCHOR_PATTERN.match(anchor)
             if rfc_match:
-                rfc_num = rfc_match.group(1)
-                ref_parts.append(f"[Local MD](rfc{rfc_num}.md)")
-
-        # Combine all parts
-        ref_text = " ".join(ref_parts)
-        self.markdown_lines.append(ref_text)
-        self.markdown_lines.append("")
+                yield f"[Local MD](rfc{rfc_match.group(1)}.md)"
 
     def _process_section(self, section, depth=1):
         """
@@ -711,56 +947,34 @@ class XmlToMdConverter:
         depth = min(depth, 6)
 
         # Extract section name
-        name_elem = section.find("name")
+        name_elem = find_first(section, "name")
         if name_elem is not None and name_elem.text:
-            header_prefix = "#" * depth
             anchor = section.get("anchor", "")
 
             # Add anchor if present
             if anchor:
-                self.markdown_lines.append(f'<a name="{anchor}"></a>')
+                self.markdown_lines.append(anchor_tag(anchor))
 
-            self.markdown_lines.append(f"{header_prefix} {name_elem.text}")
-            self.markdown_lines.append("")
+            self.markdown_lines.extend((HEADER_PREFIXES[depth] + name_elem.text, ""))
 
-        # Process all child elements in order
-        for child in section:
-            if child.tag == "t":
-                # Paragraph
-                text = self._get_element_text(child)
-                if text:
-                    indent = child.get("indent", "0")
-                    if indent != "0":
-                        text = "  " * int(indent) + text
-                    self.markdown_lines.append(text)
-                    self.markdown_lines.append("")
-            elif child.tag == "ul":
-                # Unordered list
-                self._process_list(child, ordered=False)
-            elif child.tag == "ol":
-                # Ordered list
-                self._process_list(child, ordered=True)
-            elif child.tag == "dl":
-                # Definition list
-                self._process_definition_list(child)
-            elif child.tag == "figure":
-                # Figure with artwork or sourcecode
-                self._process_figure(child)
-            elif child.tag == "artwork":
-                # Standalone artwork
-                self._process_artwork(child)
-            elif child.tag == "sourcecode":
-                # Standalone sourcecode
-                self._process_sourcecode(child)
-            elif child.tag == "table":
-                # Table
-                self._process_table(child)
-            elif child.tag == "note":
-                # Note (blockquote)
-                self._process_note(child)
-            elif child.tag == "section":
-                # Nested section
-                self._process_section(child, depth + 1)
+        # Process all child elements in order, dispatching on tag
+        handlers = self._SECTION_CHILD_HANDLERS
+        for child in section.iterchildren(*self._SECTION_CHILD_TAGS):
+            handlers[child.tag](self, child, depth)
+
+    def _process_paragraph(self, t_elem):
+        """
+        Process a <t> paragraph, honouring its indent attribute.
+
+        Args:
+            t_elem: XML t element
+        """
+        text = self._get_element_text(t_elem)
+        if text:
+            indent = t_elem.get("indent", "0")
+            if indent != "0":
+                text = indentation(int(indent)) + text
+            self.markdown_lines.extend((text, ""))
 
     def _process_list(self, list_elem, ordered=False, indent_level=0):
         """
@@ -771,10 +985,10 @@ class XmlToMdConverter:
             ordered: True for ordered lists, False for unordered
             indent_level: Current indentation level for nested lists
         """
-        indent = "  " * indent_level
+        indent = indentation(indent_level)
         counter = 1
 
-        for li in list_elem.findall("li"):
+        for li in FIND_LIST_ITEMS(list_elem):
             # Get list item text
             text = self._get_element_text(li)
 
@@ -788,18 +1002,18 @@ class XmlToMdConverter:
                 self.markdown_lines.append(f"{indent}{prefix} {text}")
 
             # Handle nested lists
-            for child in li:
+            for child in li.iterchildren("ul", "ol"):
                 if child.tag == "ul":
                     self._process_list(child, ordered=False, indent_level=indent_level + 1)
                 elif child.tag == "ol":
                     self._process_list(child, ordered=True, indent_level=indent_level + 1)
 
         if indent_level == 0:
-            self.markdown_lines.append("")
+            self._blank_line()
 
     def _process_definition_list(self, dl_elem):
         """Process definition lists."""
-        for child in dl_elem:
+        for child in dl_elem.iterchildren("dt", "dd"):
             if child.tag == "dt":
                 # Definition term
                 term = self._get_element_text(child)
@@ -808,54 +1022,60 @@ class XmlToMdConverter:
             elif child.tag == "dd":
                 # Definition description - can contain text, paragraphs, figures, nested lists
                 # Check for nested structural elements
-                has_nested_elements = any(
-                    subchild.tag in ["t", "figure", "ul", "ol", "dl", "artwork", "sourcecode"]
-                    for subchild in child
-                )
+                has_nested_elements = next(child.iterchildren(*DD_BLOCK_TAGS), None) is not None
 
                 if has_nested_elements:
                     # Process nested elements
-                    for subchild in child:
+                    for subchild in child.iterchildren("t", "figure", "ul", "ol", "dl"):
                         if subchild.tag == "t":
                             text = self._get_element_text(subchild)
                             if text:
                                 # Indent paragraphs in dd
-                                for line in text.split("\n"):
-                                    if line.strip():
-                                        self.markdown_lines.append(f"  {line}")
-                                self.markdown_lines.append("")
+                                self.markdown_lines.extend(
+                                    ["  " + line for line in text.split("\n") if line.strip()]
+                                )
+                                self._blank_line()
                         elif subchild.tag == "figure":
                             # Process nested figure with indentation
-                            saved_lines = self.markdown_lines[:]
-                            self.markdown_lines = []
-                            self._process_figure(subchild)
-                            # Indent all figure lines
-                            for line in self.markdown_lines:
-                                saved_lines.append(f"  {line}" if line else "")
-                            self.markdown_lines = saved_lines
+                            self._emit_indented(self._process_figure, subchild)
                         elif subchild.tag in ["ul", "ol"]:
                             self._process_list(
                                 subchild, ordered=(subchild.tag == "ol"), indent_level=1
                             )
                         elif subchild.tag == "dl":
                             # Nested definition list - indent it
-                            saved_lines = self.markdown_lines[:]
-                            self.markdown_lines = []
-                            self._process_definition_list(subchild)
-                            for line in self.markdown_lines:
-                                saved_lines.append(f"  {line}" if line else "")
-                            self.markdown_lines = saved_lines
+                            self._emit_indented(self._process_definition_list, subchild)
                 else:
                     # Simple text content
                     desc = self._get_element_text(child)
                     if desc:
                         # Indent the description
-                        for line in desc.split("\n"):
-                            if line.strip():
-                                self.markdown_lines.append(f"  {line}")
-                        self.markdown_lines.append("")
+                        self.markdown_lines.extend(
+                            ["  " + line for line in desc.split("\n") if line.strip()]
+                        )
+                        self._blank_line()
 
-        self.markdown_lines.append("")
+        self._blank_line()
+
+    def _emit_indented(self, process, elem):
+        """
+        Run an element processor into a fresh buffer and append its lines indented.
+
+        The output buffer is swapped rather than copied, so nesting costs are
+        proportional to the nested output only.
+
+        Args:
+            process: Bound processing method taking the element
+            elem: XML element to process
+        """
+        saved_lines = self.markdown_lines
+        self.markdown_lines = []
+        try:
+            process(elem)
+            nested_lines = self.markdown_lines
+        finally:
+            self.markdown_lines = saved_lines
+        saved_lines.extend(f"  {line}" if line else "" for line in nested_lines)
 
     def _process_figure(self, figure_elem):
         """Process figure elements containing artwork or sourcecode."""
@@ -866,36 +1086,49 @@ class XmlToMdConverter:
             figure_num = pn.replace("figure-", "") + ": "
 
         # Get figure name if present
-        name_elem = figure_elem.find("name")
+        name_elem = find_first(figure_elem, "name")
         if name_elem is not None and name_elem.text:
             if figure_num:
                 self.markdown_lines.append(f"**Figure {figure_num}{name_elem.text}**")
             else:
                 self.markdown_lines.append(f"**Figure: {name_elem.text}**")
-            self.markdown_lines.append("")
+            self._blank_line()
 
         # Process artwork or sourcecode within figure
-        for child in figure_elem:
+        for child in figure_elem.iterchildren("artwork", "sourcecode"):
             if child.tag == "artwork":
                 self._process_artwork(child, in_figure=True)
             elif child.tag == "sourcecode":
                 self._process_sourcecode(child, in_figure=True)
 
+    def _code_block(self, fence, content):
+        """
+        Append a fenced code block, one list entry per line.
+
+        Lines stay separate entries (rather than one joined string) so that
+        nested output can still be indented line by line.
+
+        Args:
+            fence: Opening fence, optionally with a language (e.g. "```json")
+            content: Raw block text; trailing whitespace is stripped per line
+        """
+        if content:
+            self.markdown_lines.extend(
+                [fence, *[line.rstrip() for line in content.split("\n")], "```"]
+            )
+        else:
+            self.markdown_lines.extend((fence, "```"))
+
     def _process_artwork(self, artwork_elem, in_figure=False):
         """Process artwork elements (ASCII art, diagrams)."""
         # Get artwork content
         content = artwork_elem.text or ""
 
-        # Preserve exact formatting with code block
-        self.markdown_lines.append("```")
-        if content:
-            # Split by lines and preserve whitespace
-            for line in content.split("\n"):
-                self.markdown_lines.append(line.rstrip())
-        self.markdown_lines.append("```")
+        # Preserve exact formatting with code block, emitted with one extend call
+        self._code_block("```", content)
 
         if not in_figure:
-            self.markdown_lines.append("")
+            self._blank_line()
 
     def _process_sourcecode(self, sourcecode_elem, in_figure=False):
         """Process sourcecode elements."""
@@ -906,83 +1139,61 @@ class XmlToMdConverter:
         content = sourcecode_elem.text or ""
 
         # Create code block with language specification
-        if lang:
-            self.markdown_lines.append(f"```{lang}")
-        else:
-            self.markdown_lines.append("```")
-
-        if content:
-            for line in content.split("\n"):
-                self.markdown_lines.append(line.rstrip())
-
-        self.markdown_lines.append("```")
+        self._code_block(f"```{lang}", content)
 
         if not in_figure:
-            self.markdown_lines.append("")
+            self._blank_line()
 
     def _process_table(self, table_elem):
         """Process table elements."""
         # Extract table name if present
-        name_elem = table_elem.find("name")
+        name_elem = find_first(table_elem, "name")
         if name_elem is not None and name_elem.text:
-            self.markdown_lines.append(f"**Table: {name_elem.text}**")
-            self.markdown_lines.append("")
-
-        # Process thead for headers
-        thead = table_elem.find("thead")
-        headers = []
-        if thead is not None:
-            tr = thead.find("tr")
-            if tr is not None:
-                for th in tr.findall("th"):
-                    headers.append(self._get_element_text(th) or "")
-
-        # Process tbody for data rows
-        tbody = table_elem.find("tbody")
-        rows = []
-        if tbody is not None:
-            for tr in tbody.findall("tr"):
-                row = []
-                for td in tr.findall("td"):
-                    row.append(self._get_element_text(td) or "")
-                if row:
-                    rows.append(row)
-
-        # Generate Markdown table
-        if headers:
-            # Header row
-            self.markdown_lines.append("| " + " | ".join(headers) + " |")
-            # Separator row
-            self.markdown_lines.append("| " + " | ".join(["---"] * len(headers)) + " |")
+            self.markdown_lines.extend((f"**Table: {name_elem.text}**", ""))
 
-        # Data rows
-        for row in rows:
-            # Pad row to match header length if needed
-            while len(row) < len(headers):
-                row.append("")
-            self.markdown_lines.append("| " + " | ".join(row) + " |")
+        get_text = self._get_element_text
 
-        self.markdown_lines.append("")
+        # Headers come from the first row of the first thead
+        headers = [get_text(th) or "" for th in FIND_HEADER_CELLS(table_elem)]
+        width = len(headers)
+        if headers:
+            # Header and separator rows
+            self.markdown_lines.extend(
+                (f"| {' | '.join(headers)} |", f"| {' | '.join(['---'] * width)} |")
+            )
+
+        # Data rows come from the first tbody, formatted as they are read
+        row_lines = []
+        for tr in FIND_BODY_ROWS(table_elem):
+            row = [get_text(td) or "" for td in FIND_DATA_CELLS(tr)]
+            if row:
+                # Pad row to match header length if needed
+                if len(row) < width:
+                    row.extend([""] * (width - len(row)))
+                row_lines.append(f"| {' | '.join(row)} |")
+        self.markdown_lines.extend(row_lines)
+
+        self._blank_line()
 
     def _process_note(self, note_elem):
         """Process note elements as blockquotes."""
         # Get note name if present
-        name_elem = note_elem.find("name")
+        name_elem = find_first(note_elem, "name")
         if name_elem is not None and name_elem.text:
             self.markdown_lines.append(f"> **{name_elem.text}**")
             self.markdown_lines.append(">")
 
         # Process paragraphs in note
-        for t_elem in note_elem.findall("t"):
+        for t_elem in FIND_PARAGRAPHS(note_elem):
             text = self._get_element_text(t_elem)
             if text:
-                # Prefix each line with >
-                for line in text.split("\n"):
-                    if line.strip():
-                        self.markdown_lines.append(f"> {line}")
+                # Prefix each non-blank line with >
+                self.markdown_lines.extend(
+                    ["> " + line for line in text.split("\n") if line.strip()]
+                )
                 self.markdown_lines.append(">")
 
-        self.markdown_lines.append("")
+        self._blank_line()
 
     def _get_element_text(self, elem):
         """
@@ -997,6 +1208,17 @@ class XmlToMdConverter:
         if elem is None:
             return ""
 
+        # Leaf elements (most table cells and many paragraphs) need no join and
+        # are cheaper to recompute than to memoize
+        if not len(elem):
+            return (elem.text or "").strip()
+
+        # Nested list items are visited both through their parent's text and on
+        # their own, so results are memoized per element for the conversion
+        cached = self._text_cache.get(elem)
+        if cached is not None:
+            return cached
+
         # Get all text including from child elements
         text_parts = []
 
@@ -1006,8 +1228,11 @@ class XmlToMdConverter:
 
         # Process child elements
         for child in elem:
-            # Handle inline formatting
-            if child.tag == "xref":
+            # Handle inline formatting; read the tag once rather than once per branch.
+            # Branches are ordered by how often the tags occur in RFC text (xref, then
+            # bcp14); an if/elif chain measured faster than a dict of handler functions
+            tag = child.tag
+            if tag == "xref":
                 # Cross-references
                 target = child.get("target", "")
                 derived_content = child.get("derivedContent", "")
@@ -1019,33 +1244,33 @@ class XmlToMdConverter:
                 else:
                     text_parts.append(f"[{child_text}](#{target})")
 
-            elif child.tag == "eref":
+            elif tag == "bcp14":
+                # BCP14 keywords (MUST, SHOULD, etc.) - make bold
+                child_text = child.text or ""
+                text_parts.append(f"**{child_text}**")
+
+            elif tag == "eref":
                 # External references
                 target = child.get("target", "")
                 child_text = child.text or target
                 text_parts.append(f"[{child_text}]({target})")
 
-            elif child.tag == "bcp14":
-                # BCP14 keywords (MUST, SHOULD, etc.) - make bold
-                child_text = child.text or ""
-                text_parts.append(f"**{child_text}**")
-
-            elif child.tag == "em":
+            elif tag == "em":
                 # Emphasis - italic
                 child_text = child.text or ""
                 text_parts.append(f"*{child_text}*")
 
-            elif child.tag == "strong":
+            elif tag == "strong":
                 # Strong - bold
                 child_text = child.text or ""
                 text_parts.append(f"**{child_text}**")
 
-            elif child.tag == "tt":
+            elif tag == "tt":
                 # Teletype - inline code
                 child_text = child.text or ""
                 text_parts.append(f"`{child_text}`")
 
-            elif child.tag == "contact":
+            elif tag == "contact":
                 # Contact - use fullname attribute if available, otherwise text
                 fullname = child.get("fullname", "")
                 child_text = fullname or child.text or ""
@@ -1061,4 +1286,6 @@ class XmlToMdConverter:
             if child.tail:
                 text_parts.append(child.tail)
 
-        return "".join(text_parts).strip()
+        text = "".join(text_parts).strip()
+        self._text_cache[elem] = text
+        return text
@@ -4,11 +4,16 @@ RFC downloader module.
 This module handles downloading RFC documents from rfc-editor.org.
 """
 
+import json
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from lib.utils import (
     extract_rfc_references_from_html,
@@ -16,9 +21,223 @@ from lib.utils import (
     normalize_rfc_number,
 )
 
+# Streamed downloads are read in 1 MiB chunks
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Maximum number of RFCs downloaded concurrently by download_rfc_recursive
+DOWNLOAD_WORKERS = 8
+
+# Connection pool size per host; at least DOWNLOAD_WORKERS so threads never wait
+HTTP_POOL_SIZE = 16
+
+# Request compressed bodies; RFC XML and HTML shrink several-fold with gzip
+HTTP_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+
+# Response headers saved after a download and the request headers that replay them
+CACHE_VALIDATORS = (("ETag", "If-None-Match"), ("Last-Modified", "If-Modified-Since"))
+
+# Validators of earlier downloads, keyed by URL. The file lives in the user's cache
+# directory so output directories only ever hold the files the user asked for. It is
+# read once at the start of a download run and written once at the end.
+VALIDATOR_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "rfc2md" / "validators.json"
+)
+
+# Transient gateway errors retried with exponential backoff before giving up
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    # Return the last response so raise_for_status() reports it as before
+    raise_on_status=False,
+)
+
+
+def _create_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all downloads.
+
+    Returns:
+        Session sending HTTP_HEADERS, with a pooled, retrying adapter for https://
+    """
+    session = requests.Session()
+    session.headers.update(HTTP_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRY
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Reusing one session keeps connections to rfc-editor.org alive between downloads
+_SESSION = _create_session()
+
+
+def _load_validator_cache() -> dict[str, dict[str, str]]:
+    """
+    Read the validator cache, keeping only entries whose files still exist.
+
+    A missing or damaged cache reads as empty. Entries for files removed since
+    they were stored (e.g. intermediate files deleted after conversion) are
+    dropped here, once per run, so the cache does not grow without bound.
+
+    Returns:
+        Mapping from URL to {"path": ..., response header: value, ...}
+    """
+    try:
+        cache = json.loads(VALIDATOR_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return {
+        url: entry
+        for url, entry in cache.items()
+        if isinstance(entry, dict) and entry.get("path") and Path(entry["path"]).exists()
+    }
+
+
+def _save_validator_cache(validators: dict[str, dict[str, str]]) -> None:
+    """
+    Write the validator cache back to disk.
+
+    Failing to write it only costs full downloads next time.
+
+    Args:
+        validators: Cache loaded by _load_validator_cache and updated in memory
+    """
+    try:
+        VALIDATOR_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        VALIDATOR_CACHE_FILE.write_text(json.dumps(validators), encoding="utf-8")
+    except OSError as e:
+        logging.getLogger(__name__).debug(
+            "Could not write validator cache %s: %s", VALIDATOR_CACHE_FILE, e
+        )
+
+
+def _conditional_headers(
+    validators: dict[str, dict[str, str]], url: str, path: Path
+) -> dict[str, str]:
+    """
+    Build If-None-Match / If-Modified-Since headers from a previous download.
+
+    Validators are only sent while the file they were stored for still exists at
+    the same location, since a 304 response means "reuse the file you have".
+
+    Args:
+        validators: Validator cache of the current run
+        url: URL about to be requested
+        path: Destination file path
+
+    Returns:
+        Conditional request headers (empty if there is nothing to revalidate)
+    """
+    entry = validators.get(url)
+    if entry is None or entry.get("path") != str(path.resolve()) or not path.exists():
+        return {}
+    return {
+        request_header: entry[response_header]
+        for response_header, request_header in CACHE_VALIDATORS
+        if entry.get(response_header)
+    }
+
+
+def _remember_validators(
+    validators: dict[str, dict[str, str]], url: str, path: Path, response: requests.Response
+) -> None:
+    """
+    Record a download's cache validators in memory, or forget stale ones.
+
+    Only single dict operations are used, which are atomic, so download threads
+    can share one cache without a lock.
+
+    Args:
+        validators: Validator cache of the current run
+        url: Downloaded URL
+        path: File the response body was saved to
+        response: Response whose headers carry the validators
+    """
+    entry = {
+        response_header: value
+        for response_header, _request_header in CACHE_VALIDATORS
+        if (value := response.headers.get(response_header))
+    }
+    if entry:
+        validators[url] = {"path": str(path.resolve()), **entry}
+    else:
+        # Drop validators from an older download so they are not replayed
+        validators.pop(url, None)
+
+
+def _save_response(response: requests.Response, path: Path) -> int:
+    """
+    Write a streamed response body to a file.
+
+    The chunks are handed to file.writelines, so the copy loop runs in C with no
+    per-chunk Python bookkeeping. A 304 Not Modified response keeps the existing
+    file.
+
+    Args:
+        response: Streamed response (requested with stream=True)
+        path: Destination file path
+
+    Returns:
+        Number of bytes written (or the size of the reused file)
+    """
+    if response.status_code == 304:
+        response.close()
+        logging.getLogger(__name__).info(f"Not modified, reusing {path}")
+        return path.stat().st_size
+
+    with open(path, "wb") as f:
+        f.writelines(response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE))
+        return f.tell()
+
+
+def _stream_to_file(
+    url: str,
+    path: Path,
+    validators: dict[str, dict[str, str]] | None = None,
+    timeout: int = 30,
+) -> tuple[int, float]:
+    """
+    Download a URL into a file through the shared session.
+
+    With a validator cache, validators stored by an earlier download of the
+    same URL are sent along, so an unchanged file is answered with 304 and kept.
+    Errors are left to the caller, which decides how to log them and whether to
+    fall back to another URL.
+
+    Args:
+        url: URL to download
+        path: Destination file path
+        validators: Validator cache of the current run (None: plain download)
+        timeout: Request timeout in seconds
+
+    Returns:
+        Tuple of (bytes on disk, seconds spent saving the body)
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+        OSError: If the file cannot be written
+    """
+    headers = _conditional_headers(validators, url, path) if validators is not None else {}
+    response = _SESSION.get(url, headers=headers, timeout=timeout, stream=True)
+    response.raise_for_status()
+
+    start_time = time.time()
+    downloaded = _save_response(response, path)
+    if validators is not None and response.status_code != 304:
+        _remember_validators(validators, url, path, response)
+    return downloaded, time.time() - start_time
+
 
 def download_rfc_html(
-    rfc_number: str, output_dir: Path, current: int | None = None, total: int | None = None
+    rfc_number: str,
+    output_dir: Path,
+    current: int | None = None,
+    total: int | None = None,
+    validators: dict[str, dict[str, str]] | None = None,
 ) -> Path | None:
     """
     Download RFC HTML from rfc-editor.org.
@@ -28,10 +247,19 @@ def download_rfc_html(
         output_dir: Path object for output directory
         current: Current RFC number in sequence (for progress tracking)
         total: Total number of RFCs to download (for progress tracking)
+        validators: Validator cache shared by the caller's run; if None, the cache
+            is loaded here and written back once the download finishes
 
     Returns:
         Path to downloaded HTML file, or None if download failed
     """
+    if validators is None:
+        validators = _load_validator_cache()
+        try:
+            return download_rfc_html(rfc_number, output_dir, current, total, validators)
+        finally:
+            _save_validator_cache(validators)
+
     logger = logging.getLogger(__name__)
 
     # Extract numeric part for URL construction
@@ -46,29 +274,7 @@ def download_rfc_html(
     logger.info(f"Downloading RFC {rfc_num}{progress_msg} HTML from: {html_url}")
 
     try:
-        response = requests.get(html_url, timeout=30, stream=True)
-        response.raise_for_status()
-
-        # Get file size if available
-        total_size = int(response.headers.get("content-length", 0))
-
-        # Download with progress indication
-        downloaded = 0
-        chunk_size = 8192
-        start_time = time.time()
-
-        with open(html_file, "wb") as f:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size > 0:
-                        percent = (downloaded / total_size) * 100
-                        logger.debug(
-                            f"Downloaded: {downloaded}/{total_size} bytes ({percent:.1f}%)"
-                        )
-
-        elapsed = time.time() - start_time
+        downloaded, elapsed = _stream_to_file(html_url, html_file, validators)
         logger.info(
             f"HTML downloaded successfully: {html_file} ({downloaded} bytes in {elapsed:.2f}s)"
         )
@@ -101,6 +307,7 @@ def download_rfc(
     extra_formats: list[str] | None = None,
     current: int | None = None,
     total: int | None = None,
+    validators: dict[str, dict[str, str]] | None = None,
 ) -> tuple[Path, dict[str, Path]] | None:
     """
     Download RFC XML and optionally additional formats from rfc-editor.org.
@@ -112,12 +319,21 @@ def download_rfc(
         extra_formats: List of additional formats to download (pdf, text, xml, html)
         current: Current RFC number in sequence (for progress tracking)
         total: Total number of RFCs to download (for progress tracking)
+        validators: Validator cache shared by the caller's run; if None, the cache
+            is loaded here and written back once all formats are downloaded
 
     Returns:
         Tuple of (primary_file, extra_files_dict) where:
         - primary_file: Path to downloaded XML or HTML file, or None if download failed
         - extra_files_dict: Dictionary mapping format names to their file paths
     """
+    if validators is None:
+        validators = _load_validator_cache()
+        try:
+            return download_rfc(rfc_number, output_dir, extra_formats, current, total, validators)
+        finally:
+            _save_validator_cache(validators)
+
     logger = logging.getLogger(__name__)
 
     # Initialize extra_formats if not provided
@@ -140,29 +356,7 @@ def download_rfc(
     logger.info(f"Downloading RFC {rfc_num}{progress_msg} XML from: {xml_url}")
 
     try:
-        response = requests.get(xml_url, timeout=30, stream=True)
-        response.raise_for_status()
-
-        # Get file size if available
-        total_size = int(response.headers.get("content-length", 0))
-
-        # Download with progress indication
-        downloaded = 0
-        chunk_size = 8192
-        start_time = time.time()
-
-        with open(xml_file, "wb") as f:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size > 0:
-                        percent = (downloaded / total_size) * 100
-                        logger.debug(
-                            f"Downloaded: {downloaded}/{total_size} bytes ({percent:.1f}%)"
-                        )
-
-        elapsed = time.time() - start_time
+        downloaded, elapsed = _stream_to_file(xml_url, xml_file, validators)
         logger.info(
             f"XML downloaded successfully: {xml_file} ({downloaded} bytes in {elapsed:.2f}s)"
         )
@@ -171,7 +365,7 @@ def download_rfc(
         if e.response.status_code == 404:
             logger.warning(f"RFC XML not found: {rfc_number} (404 error), trying HTML fallback")
             # Try HTML fallback
-            html_file = download_rfc_html(rfc_number, output_dir, current, total)
+            html_file = download_rfc_html(rfc_number, output_dir, current, total, validators)
             if html_file:
                 downloaded_file = html_file
             else:
@@ -201,25 +395,7 @@ def download_rfc(
             logger.info(f"Downloading PDF from: {pdf_url}")
 
             try:
-                response = requests.get(pdf_url, timeout=30, stream=True)
-                response.raise_for_status()
-
-                total_size = int(response.headers.get("content-length", 0))
-                downloaded = 0
-                start_time = time.time()
-
-                with open(pdf_file, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            if total_size > 0:
-                                percent = (downloaded / total_size) * 100
-                                logger.debug(
-                                    f"Downloaded: {downloaded}/{total_size} bytes ({percent:.1f}%)"
-                                )
-
-                elapsed = time.time() - start_time
+                downloaded, elapsed = _stream_to_file(pdf_url, pdf_file, validators)
                 logger.info(
                     f"PDF downloaded successfully: {pdf_file} ({downloaded} bytes in {elapsed:.2f}s)"
                 )
@@ -232,20 +408,9 @@ def download_rfc(
                     logger.info(f"Primary PDF not found, trying fallback: {pdf_url_fallback}")
 
                     try:
-                        response = requests.get(pdf_url_fallback, timeout=30, stream=True)
-                        response.raise_for_status()
-
-                        total_size = int(response.headers.get("content-length", 0))
-                        downloaded = 0
-                        start_time = time.time()
-
-                        with open(pdf_file, "wb") as f:
-                            for chunk in response.iter_content(chunk_size=8192):
-                                if chunk:
-                                    f.write(chunk)
-                                    downloaded += len(chunk)
-
-                        elapsed = time.time() - start_time
+                        downloaded, elapsed = _stream_to_file(
+                            pdf_url_fallback, pdf_file, validators
+                        )
                         logger.info(
                             f"PDF downloaded successfully (fallback): {pdf_file} ({downloaded} bytes in {elapsed:.2f}s)"
                         )
@@ -266,25 +431,7 @@ def download_rfc(
             logger.info(f"Downloading text from: {text_url}")
 
             try:
-                response = requests.get(text_url, timeout=30, stream=True)
-                response.raise_for_status()
-
-                total_size = int(response.headers.get("content-length", 0))
-                downloaded = 0
-                start_time = time.time()
-
-                with open(text_file, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            if total_size > 0:
-                                percent = (downloaded / total_size) * 100
-                                logger.debug(
-                                    f"Downloaded: {downloaded}/{total_size} bytes ({percent:.1f}%)"
-                                )
-
-                elapsed = time.time() - start_time
+                downloaded, elapsed = _stream_to_file(text_url, text_file, validators)
                 logger.info(
                     f"Text downloaded successfully: {text_file} ({downloaded} bytes in {elapsed:.2f}s)"
                 )
@@ -308,13 +455,55 @@ def download_rfc(
                 logger.info(f"HTML already downloaded as primary file: {downloaded_file}")
             else:
                 # Download HTML explicitly
-                html_file = download_rfc_html(rfc_number, output_dir, current, total)
+                html_file = download_rfc_html(rfc_number, output_dir, current, total, validators)
                 if html_file:
                     extra_files["html"] = html_file
 
     return (downloaded_file, extra_files)
 
 
+def _find_downloaded_rfc(rfc_number: str, output_dir: Path) -> Path | None:
+    """
+    Return an already downloaded XML or HTML file for an RFC, if one exists.
+
+    Args:
+        rfc_number: Normalized RFC number (e.g., "rfc9514")
+        output_dir: Directory the RFC would have been downloaded to
+
+    Returns:
+        Path to the existing XML (preferred) or HTML file, or None
+    """
+    for suffix in (".xml", ".html"):
+        existing_file = output_dir / f"{rfc_number}{suffix}"
+        if existing_file.exists():
+            return existing_file
+    return None
+
+
+def _extract_references(rfc_number: str, primary_file: Path) -> set[str]:
+    """
+    Extract referenced RFC numbers from a downloaded RFC, logging any failure.
+
+    Args:
+        rfc_number: Normalized RFC number the file belongs to
+        primary_file: Downloaded XML or HTML file
+
+    Returns:
+        Set of normalized referenced RFC numbers (empty on error)
+    """
+    logger = logging.getLogger(__name__)
+    try:
+        # Choose extraction method based on file type
+        if primary_file.suffix.lower() == ".xml":
+            return extract_rfc_references_from_xml(primary_file)
+        if primary_file.suffix.lower() == ".html":
+            return extract_rfc_references_from_html(primary_file)
+        return set()
+    except Exception as e:
+        logger.warning(f"Error extracting references from {rfc_number}: {e}")
+        return set()
+
+
 def download_rfc_recursive(
     rfc_number: str,
     output_dir: Path,
@@ -323,10 +512,15 @@ def download_rfc_recursive(
     processed: set[str] | None = None,
     _total_count: int | None = None,
     _current_count: list[int] | None = None,
+    max_workers: int = DOWNLOAD_WORKERS,
 ) -> dict[str, tuple[Path, dict[str, Path]]]:
     """
     Recursively download RFC and all referenced RFCs.
 
+    References are followed breadth-first, one depth level at a time. The
+    downloads and reference extractions of a level run concurrently in a thread
+    pool, so network latency overlaps across RFCs instead of adding up.
+
     Args:
         rfc_number: RFC number to download (will be normalized)
         output_dir: Directory to save downloaded files
@@ -335,6 +529,7 @@ def download_rfc_recursive(
         processed: Set of already processed RFCs (for internal use)
         _total_count: Total number of RFCs to download (for internal use)
         _current_count: Current count as a mutable list (for internal use)
+        max_workers: Maximum number of concurrent downloads per level
 
     Returns:
         Dictionary mapping RFC numbers to tuples of (primary_file, extra_files_dict)
@@ -349,83 +544,76 @@ def download_rfc_recursive(
     if _current_count is None:
         _current_count = [0]
 
-    # Normalize RFC number
-    rfc_number = normalize_rfc_number(rfc_number)
-
-    # Check if already processed
-    if rfc_number in processed:
-        logger.debug(f"RFC {rfc_number} already processed, skipping")
-        return {}
-
-    # Add to processed set
-    processed.add(rfc_number)
-
     # Initialize result dictionary
     result: dict[str, tuple[Path, dict[str, Path]]] = {}
 
-    # Determine file paths (could be XML or HTML)
-    xml_file = output_dir / f"{rfc_number}.xml"
-    html_file = output_dir / f"{rfc_number}.html"
-
-    # Check if file already exists (XML or HTML)
-    if xml_file.exists():
-        logger.info(f"RFC {rfc_number} XML already downloaded, skipping download")
-        primary_file = xml_file
-        # For existing files, return empty extra_files dict
-        result[rfc_number] = (primary_file, {})
-    elif html_file.exists():
-        logger.info(f"RFC {rfc_number} HTML already downloaded, skipping download")
-        primary_file = html_file
-        # For existing files, return empty extra_files dict
-        result[rfc_number] = (primary_file, {})
-    else:
-        # Increment current count and download the RFC
-        _current_count[0] += 1
-        current = _current_count[0]
-
-        # Download the RFC with progress tracking
-        logger.info(f"Downloading RFC {rfc_number}...")
-        download_result = download_rfc(rfc_number, output_dir, extra_formats, current, _total_count)
-
-        if download_result is None:
-            logger.error(f"Failed to download RFC {rfc_number}")
-            return result
-
-        primary_file, extra_files = download_result
-
-        # Add to result with extra files
-        result[rfc_number] = (primary_file, extra_files)
+    # One validator cache for the whole run, shared by the download threads and
+    # written back once at the end
+    validators = _load_validator_cache()
+
+    # processed, result and the progress counter are only touched by this thread;
+    # workers just download files and extract references
+    level = [normalize_rfc_number(rfc_number)]
+    depth = max_depth
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while level:
+            # Skip RFCs already processed (deduplicating while keeping order)
+            pending = []
+            for rfc in dict.fromkeys(level):
+                if rfc in processed:
+                    logger.debug("RFC %s already processed, skipping", rfc)
+                else:
+                    processed.add(rfc)
+                    pending.append(rfc)
+
+            # Reuse existing files (XML or HTML) and download the rest concurrently
+            downloads = {}
+            for rfc in pending:
+                existing_file = _find_downloaded_rfc(rfc, output_dir)
+                if existing_file is not None:
+                    logger.info(
+                        f"RFC {rfc} {existing_file.suffix[1:].upper()} already downloaded, "
+                        "skipping download"
+                    )
+                    # For existing files, return empty extra_files dict
+                    result[rfc] = (existing_file, {})
+                else:
+                    # Increment current count and download the RFC with progress tracking
+                    _current_count[0] += 1
+                    logger.info(f"Downloading RFC {rfc}...")
+                    downloads[rfc] = executor.submit(
+                        download_rfc,
+                        rfc,
+                        output_dir,
+                        extra_formats,
+                        _current_count[0],
+                        _total_count,
+                        validators,
+                    )
+
+            for rfc, future in downloads.items():
+                download_result = future.result()
+                if download_result is None:
+                    logger.error(f"Failed to download RFC {rfc}")
+                else:
+                    result[rfc] = download_result
 
-    # Extract references if max_depth > 0
-    if max_depth > 0:
-        try:
-            # Choose extraction method based on file type
-            if primary_file.suffix.lower() == ".xml":
-                references = extract_rfc_references_from_xml(primary_file)
-            elif primary_file.suffix.lower() == ".html":
-                references = extract_rfc_references_from_html(primary_file)
-            else:
-                references = set()
+            # Extract references if max_depth > 0
+            if depth <= 0:
+                break
 
-            logger.info(
-                f"Found {len(references)} RFC reference(s) in {rfc_number} (depth {max_depth})"
+            fetched = [rfc for rfc in pending if rfc in result]
+            reference_sets = executor.map(
+                _extract_references, fetched, [result[rfc][0] for rfc in fetched]
             )
 
-            # Recursively download referenced RFCs
-            for ref_rfc in references:
-                logger.info(f"Found reference to RFC {ref_rfc} (depth {max_depth})")
-                ref_result = download_rfc_recursive(
-                    ref_rfc,
-                    output_dir,
-                    extra_formats,
-                    max_depth - 1,
-                    processed,
-                    _total_count,
-                    _current_count,
-                )
-                result.update(ref_result)
-
-        except Exception as e:
-            logger.warning(f"Error extracting references from {rfc_number}: {e}")
+            level = []
+            for rfc, references in zip(fetched, reference_sets, strict=True):
+                logger.info(f"Found {len(references)} RFC reference(s) in {rfc} (depth {depth})")
+                for ref_rfc in references:
+                    logger.info(f"Found reference to RFC {ref_rfc} (depth {depth})")
+                    level.append(normalize_rfc_number(ref_rfc))
+            depth -= 1
 
+    _save_validator_cache(validators)
     return result
@@ -9,7 +9,24 @@ import logging
 import re
 from pathlib import Path
 
-from bs4 import BeautifulSoup
+import lxml.html
+
+# Pagination artifacts: "Author   Standards Track   [Page N]" footers and
+# "RFC NNNN   Title   Month YYYY" headers
+PAGE_FOOTER_PATTERN = re.compile(r"^.+\s{6,}.+\s+\[Page \d+\]$")
+PAGE_HEADER_PATTERN = re.compile(r"^RFC \d+\s+.+\s+\w+ \d{4}$")
+
+# TOC line endings: "Title....3" page numbers and ". . . ." alignment dots
+TOC_PAGE_NUMBER_PATTERN = re.compile(r"\.+\s*\d+$")
+TOC_TRAILING_DOTS_PATTERN = re.compile(r"\.+\s*\d*$")
+TOC_ALIGNMENT_DOTS_PATTERN = re.compile(r"\s*(\.\s+)+\.\s*$")
+
+# TOC entries: "1.1    Title" (RFC3209 style) and "1.1. Title" (standard style)
+RFC3209_TOC_ENTRY_PATTERN = re.compile(r"^(\d+(?:\.\d+)*)\s{2,}(.+)$")
+STANDARD_TOC_ENTRY_PATTERN = re.compile(r"^(\d+(?:\.\d+)*)\.(\s*)(.*)$")
+
+# Section headers in the body text: "1.2. Title"
+SECTION_HEADER_PATTERN = re.compile(r"^(\d+(?:\.\d+)*)\.\s+(.+)$")
 
 
 class HtmlToMdConverter:
@@ -21,6 +38,9 @@ class HtmlToMdConverter:
     and link preservation.
     """
 
+    # Fixed instance attributes: no per-instance __dict__, faster attribute access
+    __slots__ = ("html_file", "logger", "markdown_lines", "tree")
+
     def __init__(self, html_file):
         """
         Initialize the converter with an HTML file.
@@ -30,7 +50,7 @@ class HtmlToMdConverter:
         """
         self.html_file = Path(html_file)
         self.logger = logging.getLogger(__name__)
-        self.soup: BeautifulSoup | None = None
+        self.tree: lxml.html.HtmlElement | None = None
         self.markdown_lines: list[str] = []
 
     def convert(self):
@@ -42,32 +62,40 @@ class HtmlToMdConverter:
         """
         self.logger.info(f"Parsing HTML file: {self.html_file}")
 
-        # Parse HTML
+        # Parse HTML with libxml2, decoding the raw bytes as UTF-8 inside the parser
         try:
-            with open(self.html_file, encoding="utf-8") as f:
-                html_content = f.read()
-            self.soup = BeautifulSoup(html_content, "html.parser")
+            html_bytes = self.html_file.read_bytes()
+            # libxml2 rejects a blank document, so treat it as a page without <pre> blocks
+            if not html_bytes.strip():
+                html_bytes = b"<html></html>"
+            self.tree = lxml.html.document_fromstring(
+                html_bytes, parser=lxml.html.HTMLParser(encoding="utf-8")
+            )
         except Exception as e:
             raise ValueError(f"Error parsing HTML: {e}") from e
 
-        # Ensure soup is not None
-        assert self.soup is not None, "Failed to parse HTML"
+        # Ensure tree is not None
+        assert self.tree is not None, "Failed to parse HTML"
 
-        # Extract raw text and remove links
+        # Extract raw text; text_content() already drops the <a> markup of the
+        # rendered links, so any "<a ...>" left in the text is RFC content
         raw_text = self._extract_raw_text()
-        text_without_links = self._remove_links(raw_text)
+
+        # The remaining stages work on one list of lines, split once here and
+        # joined once by _process_sections
+        lines = raw_text.split("\n")
 
         # Remove page breaks
-        text_without_page_breaks = self._remove_page_breaks(text_without_links)
+        lines = self._remove_page_breaks(lines)
 
         # Collapse multiple empty lines
-        text_collapsed = self._collapse_empty_lines(text_without_page_breaks)
+        lines = self._collapse_empty_lines(lines)
 
         # Extract and format Table of Contents
-        text_with_formatted_toc, formatted_toc, toc_start_line = self._extract_toc(text_collapsed)
+        lines, formatted_toc, toc_start_line = self._extract_toc(lines)
 
         # Process sections and wrap in pre blocks with anchors
-        text_with_sections = self._process_sections(text_with_formatted_toc, toc_start_line)
+        text_with_sections = self._process_sections(lines, toc_start_line)
 
         # Document is ready
         return text_with_sections
@@ -82,52 +110,22 @@ class HtmlToMdConverter:
         Returns:
             String containing all extracted text from pre blocks
         """
-        assert self.soup is not None, "HTML must be parsed before extracting text"
+        assert self.tree is not None, "HTML must be parsed before extracting text"
         self.logger.debug("Extracting raw text from pre blocks")
 
-        # Find all pre blocks
-        pre_blocks = self.soup.find_all("pre")
-        self.logger.debug(f"Found {len(pre_blocks)} pre blocks")
-
-        # Extract text from each pre block
-        text_parts = []
-        for pre in pre_blocks:
-            text = pre.get_text()
-            text_parts.append(text)
+        # Extract text from each pre block in document order
+        text_parts = [pre.text_content() for pre in self.tree.iter("pre")]
+        self.logger.debug("Found %d pre blocks", len(text_parts))
 
         # Combine all text parts
         full_text = "\n".join(text_parts)
-        self.logger.debug(f"Extracted {len(full_text)} characters of text")
+        self.logger.debug("Extracted %d characters of text", len(full_text))
 
         return full_text
 
-    def _remove_links(self, text):
-        """
-        Remove all HTML link tags from text while preserving link text.
-
-        This method removes <a> tags but keeps the text content of the links.
-        It handles both opening and closing tags.
-
-        Args:
-            text: Input text containing HTML link tags
-
-        Returns:
-            String with HTML link tags removed but text preserved
-        """
-        self.logger.debug("Removing HTML links from text")
-
-        # Remove opening <a> tags with any attributes
-        text = re.sub(r"<a[^>]*>", "", text)
-
-        # Remove closing </a> tags
-        text = re.sub(r"</a>", "", text)
-
-        self.logger.debug("HTML links removed")
-        return text
-
-    def _remove_page_breaks(self, text):
+    def _remove_page_breaks(self, lines):
         """
-        Remove RFC page break patterns from text.
+        Remove RFC page break lines.
 
         This method removes pagination artifacts including:
         - Author/page number headers with various RFC categories:
@@ -140,80 +138,86 @@ class HtmlToMdConverter:
         - Page separator lines (lines with only dashes)
 
         Args:
-            text: Input text containing page breaks
+            lines: Input lines containing page breaks
 
         Returns:
-            String with page breaks removed
+            List of lines with page breaks removed
         """
         self.logger.debug("Removing page breaks from text")
 
-        lines = text.split("\n")
-        cleaned_lines = []
-
-        for line in lines:
-            # Skip lines matching page break pattern:
-            # text + 6+ spaces + text + spaces + [Page N]
-            # This matches all RFC status categories (Standards Track, Informational, etc.)
-            if re.match(r"^.+\s{6,}.+\s+\[Page \d+\]$", line):
-                continue
-
-            # Skip lines with "RFC NNNN" and date pattern
-            if re.search(r"^RFC \d+\s+.+\s+\w+ \d{4}$", line):
-                continue
-
-            # Skip lines that are only dashes or form feed characters
-            if re.match(r"^[\s\-\f]+$", line) and len(line.strip("-").strip()) == 0:
-                continue
-
-            cleaned_lines.append(line)
-
-        result = "\n".join(cleaned_lines)
-        self.logger.debug(f"Removed {len(lines) - len(cleaned_lines)} page break lines")
-
-        return result
-
-    def _collapse_empty_lines(self, text):
+        # Keep every line that is not a page break artifact, filtered in a single
+        # comprehension. Skipped lines are:
+        # - separators made only of dashes, whitespace or form feeds (if stripping the
+        #   edge dashes leaves only whitespace, the line has nothing else in it)
+        # - footers: text + 6+ spaces + text + spaces + [Page N], for all RFC status
+        #   categories; the endswith() check is exact and avoids the pattern's heavy
+        #   backtracking on the many indented lines that cannot be footers
+        # - headers: "RFC NNNN" + title + date
+        cleaned_lines = [
+            line
+            for line in lines
+            if not (
+                (line and not line.strip("-").strip())
+                or (line.endswith("]") and PAGE_FOOTER_PATTERN.match(line))
+                or (line.startswith("RFC ") and PAGE_HEADER_PATTERN.match(line))
+            )
+        ]
+
+        self.logger.debug("Removed %d page break lines", len(lines) - len(cleaned_lines))
+
+        return cleaned_lines
+
+    def _collapse_empty_lines(self, lines):
         """
         Collapse multiple consecutive empty lines into a single empty line.
 
-        This method finds sequences of three or more newlines and replaces them
-        with exactly two newlines (one empty line), preserving document structure
-        while removing excessive whitespace.
+        This is the line-list form of replacing three or more newlines with
+        exactly two: a run of empty lines between text lines becomes one empty
+        line, a run at the start or end keeps at most two, and a text made only
+        of empty lines keeps at most three.
 
         Args:
-            text: Input text with potential multiple empty lines
+            lines: Input lines with potential multiple empty lines
 
         Returns:
-            String with multiple empty lines collapsed to single empty lines
+            List of lines with multiple empty lines collapsed to single empty lines
         """
         self.logger.debug("Collapsing multiple empty lines")
 
-        # Replace three or more consecutive newlines with exactly two
-        # This preserves single empty lines while removing multiple ones
-        result = re.sub(r"\n\n\n+", "\n\n", text)
+        collapsed: list[str] = []
+        blank_run = 0
+        for line in lines:
+            if not line:
+                blank_run += 1
+                continue
+            if blank_run:
+                collapsed.extend([""] * (1 if collapsed else min(blank_run, 2)))
+                blank_run = 0
+            collapsed.append(line)
+        if blank_run:
+            collapsed.extend([""] * min(blank_run, 2 if collapsed else 3))
 
         self.logger.debug("Empty lines collapsed")
-        return result
+        return collapsed
 
-    def _extract_toc(self, text):
+    def _extract_toc(self, lines):
         """
-        Extract and format the Table of Contents from text.
+        Extract and format the Table of Contents from text lines.
 
         This method finds the TOC section, extracts it from the main text,
         and formats each entry as a monospace markdown link with preserved indentation.
 
         Args:
-            text: Input text containing the Table of Contents
+            lines: Input lines containing the Table of Contents
 
         Returns:
-            Tuple of (text_with_formatted_toc, formatted_toc, toc_start_line) where:
-            - text_with_formatted_toc: Text with old TOC replaced by formatted TOC
+            Tuple of (lines_with_formatted_toc, formatted_toc, toc_start_line) where:
+            - lines_with_formatted_toc: Lines with old TOC replaced by formatted TOC lines
             - formatted_toc: Formatted TOC as markdown string (for reference)
             - toc_start_line: Line number where TOC starts (for wrapping pre-TOC content)
         """
         self.logger.debug("Extracting Table of Contents")
 
-        lines = text.split("\n")
         toc_start = -1
         toc_end = -1
 
@@ -229,14 +233,14 @@ class HtmlToMdConverter:
 
         if toc_start == -1:
             self.logger.debug("No Table of Contents found")
-            return text, "", -1
+            return lines, "", -1
 
         # Find TOC end - next line that starts without leading spaces (next section)
         for i in range(toc_start + 1, len(lines)):
             line = lines[i]
             # TOC ends when we hit a line that starts without spaces and is not empty
             # and is not a TOC entry (doesn't have dots and page numbers)
-            if line and not line[0].isspace() and not re.search(r"\.+\s*\d+$", line):
+            if line and not line[0].isspace() and not TOC_PAGE_NUMBER_PATTERN.search(line):
                 toc_end = i
                 break
 
@@ -259,12 +263,12 @@ class HtmlToMdConverter:
 
         formatted_toc = "\n".join(formatted_entries)
 
-        # Replace old TOC with formatted TOC in the text
-        text_with_formatted_toc = "\n".join(lines[:toc_start] + [formatted_toc] + lines[toc_end:])
+        # Replace old TOC with formatted TOC entries, one line each
+        lines_with_formatted_toc = [*lines[:toc_start], *formatted_entries, *lines[toc_end:]]
 
-        self.logger.debug(f"Extracted TOC with {len(formatted_entries)} entries")
+        self.logger.debug("Extracted TOC with %d entries", len(formatted_entries))
 
-        return text_with_formatted_toc, formatted_toc, toc_start
+        return lines_with_formatted_toc, formatted_toc, toc_start
 
     def _format_toc_entry(self, line):
         """
@@ -284,13 +288,8 @@ class HtmlToMdConverter:
         Returns:
             Formatted markdown string or None if line is empty after cleaning
         """
-        # Extract leading spaces
-        leading_spaces = ""
-        for char in line:
-            if char == " ":
-                leading_spaces += char
-            else:
-                break
+        # Extract leading spaces (lstrip scans in C instead of a per-character loop)
+        leading_spaces = line[: len(line) - len(line.lstrip(" "))]
 
         # Clean the line (remove dots and page numbers)
         line_cleaned = self._clean_toc_line(line)
@@ -322,11 +321,11 @@ class HtmlToMdConverter:
         """
         # Step 1: Remove trailing dots and page numbers
         # This handles RFC7752 format: "Introduction....3"
-        line_cleaned = re.sub(r"\.+\s*\d*$", "", line).strip()
+        line_cleaned = TOC_TRAILING_DOTS_PATTERN.sub("", line).strip()
 
         # Step 2: Remove alignment dots for RFC8402 format: ". . . . . ."
         # Pattern matches: space, dot, (space dot)+ at end of line
-        line_cleaned = re.sub(r"\s*(\.\s+)+\.\s*$", "", line_cleaned).strip()
+        line_cleaned = TOC_ALIGNMENT_DOTS_PATTERN.sub("", line_cleaned).strip()
 
         return line_cleaned
 
@@ -343,7 +342,7 @@ class HtmlToMdConverter:
             Formatted string if match found, None otherwise
         """
         # RFC3209 format: section number followed by 2+ spaces (no trailing period)
-        match = re.match(r"^(\d+(?:\.\d+)*)\s{2,}(.+)$", line_cleaned)
+        match = RFC3209_TOC_ENTRY_PATTERN.match(line_cleaned)
         if match:
             section_num = match.group(1)
             section_title = match.group(2).strip()
@@ -364,7 +363,7 @@ class HtmlToMdConverter:
             Formatted string if match found, None otherwise
         """
         # Standard format: section number followed by period
-        match = re.match(r"^(\d+(?:\.\d+)*)\.(\s*)(.*)$", line_cleaned)
+        match = STANDARD_TOC_ENTRY_PATTERN.match(line_cleaned)
         if match:
             section_num = match.group(1)
             section_title = match.group(3).strip()
@@ -388,7 +387,7 @@ class HtmlToMdConverter:
         anchor_id = section_num.replace(".", "-")
         return f"section-{anchor_id}"
 
-    def _process_sections(self, text, toc_start_line):
+    def _process_sections(self, lines, toc_start_line):
         r"""
         Find section headers and wrap text segments in pre blocks with anchors.
 
@@ -401,7 +400,7 @@ class HtmlToMdConverter:
         6. Assembles document: pre block (before TOC) → TOC → pre block → header → pre block → header → ...
 
         Args:
-            text: Input text with section headers and formatted TOC
+            lines: Input lines with section headers and formatted TOC
             toc_start_line: Line number where TOC starts (to wrap pre-TOC content)
 
         Returns:
@@ -409,76 +408,70 @@ class HtmlToMdConverter:
         """
         self.logger.debug("Processing sections and wrapping in pre blocks")
 
-        lines = text.split("\n")
-
-        # Find all section headers with their positions
-        section_positions: list[dict[str, int | str]] = []
-        section_pattern = re.compile(r"^(\d+(?:\.\d+)*)\.\s+(.+)$")
+        # Find all section headers, kept as parallel lists of line numbers, section
+        # numbers and titles; headers start with a digit, so other lines skip the
+        # regex (isdigit() covers \d)
+        match_header = SECTION_HEADER_PATTERN.match
+        section_lines: list[int] = []
+        section_nums: list[str] = []
+        section_titles: list[str] = []
 
         for i, line in enumerate(lines):
-            match = section_pattern.match(line)
-            if match:
-                section_num = match.group(1)
-                section_title = match.group(2)
-                section_positions.append(
-                    {"line_num": i, "section_num": section_num, "title": section_title}
-                )
+            if line[:1].isdigit():
+                match = match_header(line)
+                if match:
+                    section_lines.append(i)
+                    section_nums.append(match.group(1))
+                    section_titles.append(match.group(2))
 
-        self.logger.debug(f"Found {len(section_positions)} section headers")
+        self.logger.debug("Found %d section headers", len(section_lines))
 
         # Build the document with pre blocks and section headers
         result_parts = []
 
         # Determine where the first section starts
-        first_section_line: int = (
-            int(section_positions[0]["line_num"]) if section_positions else len(lines)
-        )
+        first_section_line = section_lines[0] if section_lines else len(lines)
 
         # Handle content before first section based on whether TOC exists
         if toc_start_line >= 0:
             # TOC exists - wrap content before TOC in pre block
             if toc_start_line > 0:
-                pre_toc_content = "\n".join(lines[:toc_start_line])
                 result_parts.append("```text")
-                result_parts.append(pre_toc_content)
-                result_parts.append("```")
-                result_parts.append("")
+                result_parts.extend(lines[:toc_start_line])
+                result_parts.extend(("```", ""))
 
             # Add TOC section (already formatted, between toc_start_line and first_section_line)
-            toc_content = "\n".join(lines[toc_start_line:first_section_line])
-            result_parts.append(toc_content)
+            result_parts.extend(lines[toc_start_line:first_section_line] or [""])
             result_parts.append("")
         else:
             # No TOC - wrap all content before first section in pre block
             if first_section_line > 0:
-                pre_section_content = "\n".join(lines[:first_section_line])
                 result_parts.append("```text")
-                result_parts.append(pre_section_content)
-                result_parts.append("```")
-                result_parts.append("")
+                result_parts.extend(lines[:first_section_line])
+                result_parts.extend(("```", ""))
 
         # Check if we have sections
-        if not section_positions:
+        if not section_lines:
             # No sections found, wrap remaining text
             if toc_start_line >= 0:
                 # Had TOC but no sections - wrap everything after TOC
-                remaining_content = "\n".join(lines[first_section_line:])
+                remaining_lines = lines[first_section_line:]
             else:
                 # No TOC and no sections - everything already wrapped above
                 return "\n".join(result_parts)
 
-            if remaining_content.strip():
+            if any(line.strip() for line in remaining_lines):
                 result_parts.append("```text")
-                result_parts.append(remaining_content)
+                result_parts.extend(remaining_lines)
                 result_parts.append("```")
             return "\n".join(result_parts)
 
-        # Process each section
-        for idx, section_info in enumerate(section_positions):
-            section_num = str(section_info["section_num"])
-            section_title = str(section_info["title"])
-            section_line = int(section_info["line_num"])
-
+        # Process each section; its content runs up to the next header line, and the
+        # last section's to the end of the document (a None slice bound)
+        next_section_lines = [*section_lines[1:], None]
+        for section_line, next_section_line, section_num, section_title in zip(
+            section_lines, next_section_lines, section_nums, section_titles, strict=True
+        ):
             # Create section header with HTML anchor and bold monospace text
             anchor_id = self._create_section_anchor(section_num)
             # Format: <a id="section-1"></a> **`1. Introduction`**
@@ -487,17 +480,12 @@ class HtmlToMdConverter:
             result_parts.append("")
 
             # Get content between this section and next section (or end of document)
-            if idx < len(section_positions) - 1:
-                next_section_line = int(section_positions[idx + 1]["line_num"])
-                content_lines = lines[section_line + 1 : next_section_line]
-            else:
-                content_lines = lines[section_line + 1 :]
+            content_lines = lines[section_line + 1 : next_section_line]
 
-            # Wrap content in pre block
-            content = "\n".join(content_lines)
+            # Wrap content in pre block; lines are spliced in so that the final
+            # join is the only place the document text is materialized
             result_parts.append("```text")
-            result_parts.append(content)
-            result_parts.append("```")
-            result_parts.append("")
+            result_parts.extend(content_lines or [""])
+            result_parts.extend(("```", ""))
 
         return "\n".join(result_parts)
@@ -4,11 +4,65 @@ Utility functions for RFC to Markdown converter.
 
 import logging
 import re
+import threading
 from pathlib import Path
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from lxml import etree
 
+# Parser options shared by every full-tree XML parse: the converter never looks
+# elements up by xml:id, and large RFCs must not hit libxml2's default limits.
+# Comments and processing instructions are dropped at parse time, so every child
+# node has a plain string tag and their text never leaks into the output.
+# Whitespace-only text is kept, since it is significant in mixed content.
+XML_PARSER_OPTIONS = {
+    "collect_ids": False,
+    "huge_tree": True,
+    "remove_comments": True,
+    "remove_pis": True,
+}
+
+_parser_cache = threading.local()
+
+# The index only reads an HTML page's <title> (or first <h1>), so only those are built
+HTML_TITLE_STRAINER = SoupStrainer(["title", "h1"])
+
+# RFC mentions in Markdown. Pattern explanation:
+# \b - word boundary to avoid false matches
+# [Rr][Ff][Cc] - case-insensitive "RFC"
+# [\s-]? - optional space or hyphen
+# (\d+) - capture group for RFC number (one or more digits)
+# (?:\.(?:md|xml|html))? - optional file extension (.md, .xml, .html)
+# (?:\.)? - optional trailing dot
+# \b - word boundary
+MARKDOWN_RFC_PATTERN = re.compile(r"\b[Rr][Ff][Cc][\s-]?(\d+)(?:\.(?:md|xml|html))?(?:\.)?\b")
+
+# RFC references in raw HTML bytes: "/rfc/rfc1234" link targets and "RFC 1234" /
+# "RFC-1234" text, in one pass. Being case-insensitive, the second alternative also
+# matches relative link targets such as "./rfc1234".
+HTML_RFC_REFERENCE_PATTERN = re.compile(rb"(?:/rfc/rfc|\bRFC[\s-]?)(\d+)\b", re.IGNORECASE)
+
+# Converted RFC file names ("rfc9514.md") and "RFC 9514 - " title prefixes for the index
+RFC_MARKDOWN_FILE_PATTERN = re.compile(r"rfc(\d+)\.md")
+RFC_TITLE_PREFIX_PATTERN = re.compile(r"^RFC\s*\d+\s*[-:]\s*", re.IGNORECASE)
+
+
+def get_xml_parser():
+    """
+    Return the XML parser configured for RFC documents.
+
+    The parser is created once per thread and reused, since lxml parsers must not
+    be shared between threads.
+
+    Returns:
+        lxml XMLParser instance
+    """
+    parser = getattr(_parser_cache, "parser", None)
+    if parser is None:
+        parser = etree.XMLParser(**XML_PARSER_OPTIONS)
+        _parser_cache.parser = parser
+    return parser
+
 
 def setup_logging(level=logging.INFO):
     """
@@ -39,12 +93,13 @@ def normalize_rfc_number(rfc_input):
     return rfc_input
 
 
-def extract_rfc_references_from_xml(xml_file: Path) -> set[str]:
+def extract_rfc_references_from_xml(xml_file: Path | etree._ElementTree) -> set[str]:
     """
     Extract RFC references from an RFC XML file.
 
     Args:
-        xml_file: Path to the RFC XML file
+        xml_file: Path to the RFC XML file, or an already parsed tree (e.g. a
+            converter's tree) so the document is not parsed a second time
 
     Returns:
         Set of normalized RFC numbers (format "rfcXXXX") found in the file
@@ -52,8 +107,11 @@ def extract_rfc_references_from_xml(xml_file: Path) -> set[str]:
     rfc_refs: set[str] = set()
 
     try:
-        # Parse the XML file
-        tree = etree.parse(str(xml_file))
+        # Parse the XML file unless a parsed tree was given
+        if isinstance(xml_file, etree._ElementTree):
+            tree = xml_file
+        else:
+            tree = etree.parse(str(xml_file), get_xml_parser())
         root = tree.getroot()
 
         # Find the back section containing references
@@ -61,8 +119,8 @@ def extract_rfc_references_from_xml(xml_file: Path) -> set[str]:
         if back is None:
             return rfc_refs
 
-        # Find all reference elements in the back section
-        references = back.findall(".//reference")
+        # Find all reference elements in the back section (single C-level descent)
+        references = back.iter("reference")
 
         for reference in references:
             # Get the anchor attribute
@@ -88,9 +146,12 @@ def extract_rfc_references_from_html(html_file: Path) -> set[str]:
     """
     Extract RFC references from an RFC HTML file.
 
-    This function parses HTML and looks for RFC references in:
-    - Links with href="/rfc/rfcXXXX" pattern
-    - Text content matching "RFC XXXX" or "RFC-XXXX" patterns
+    This function scans the raw HTML and looks for RFC references in:
+    - Link targets like href="/rfc/rfcXXXX" or href="./rfcXXXX"
+    - Text matching "RFC XXXX" or "RFC-XXXX" patterns
+
+    The document is not parsed: RFC HTML keeps references as plain ASCII, so a
+    single regex pass over the bytes finds both kinds without building a tree.
 
     Args:
         html_file: Path to the RFC HTML file
@@ -101,28 +162,11 @@ def extract_rfc_references_from_html(html_file: Path) -> set[str]:
     rfc_refs: set[str] = set()
 
     try:
-        # Read and parse HTML file
-        with open(html_file, encoding="utf-8") as f:
-            html_content = f.read()
-
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # Method 1: Extract from links with href="/rfc/rfcXXXX"
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            if isinstance(href, str):
-                # Match patterns like "/rfc/rfc1234" or "/rfc/rfc1234.html"
-                match = re.search(r"/rfc/rfc(\d+)", href)
-                if match:
-                    rfc_number = f"rfc{match.group(1)}"
-                    rfc_refs.add(rfc_number)
-
-        # Method 2: Extract from text content matching "RFC XXXX" or "RFC-XXXX"
-        text_content = soup.get_text()
-        # Find all RFC references in text (RFC followed by number)
-        rfc_pattern = re.compile(r"\bRFC[\s-]?(\d+)\b", re.IGNORECASE)
-        for match in rfc_pattern.finditer(text_content):
-            rfc_number = f"rfc{match.group(1)}"
+        html_bytes = Path(html_file).read_bytes()
+
+        # Find link targets and text references in one scan (digits are ASCII)
+        for match in HTML_RFC_REFERENCE_PATTERN.finditer(html_bytes):
+            rfc_number = f"rfc{match.group(1).decode('ascii')}"
             rfc_refs.add(rfc_number)
 
     except FileNotFoundError:
@@ -157,19 +201,8 @@ def extract_rfc_numbers_from_markdown(md_file: Path) -> set[str]:
         with open(md_file, encoding="utf-8") as f:
             md_content = f.read()
 
-        # Comprehensive regex pattern to match various RFC formats
-        # Pattern explanation:
-        # \b - word boundary to avoid false matches
-        # [Rr][Ff][Cc] - case-insensitive "RFC"
-        # [\s-]? - optional space or hyphen
-        # (\d+) - capture group for RFC number (one or more digits)
-        # (?:\.(?:md|xml|html))? - optional file extension (.md, .xml, .html)
-        # (?:\.)? - optional trailing dot
-        # \b - word boundary
-        rfc_pattern = re.compile(r"\b[Rr][Ff][Cc][\s-]?(\d+)(?:\.(?:md|xml|html))?(?:\.)?\b")
-
-        # Find all RFC references
-        for match in rfc_pattern.finditer(md_content):
+        # Find all RFC references in the various formats MARKDOWN_RFC_PATTERN accepts
+        for match in MARKDOWN_RFC_PATTERN.finditer(md_content):
             rfc_number = f"rfc{match.group(1)}"
             rfc_refs.add(rfc_number)
 
@@ -195,7 +228,7 @@ def build_index_file(output_dir: Path) -> None:
     for md_file in output_dir.glob("rfc*.md"):
         if md_file.name != "index.md":
             # Extract RFC number from filename
-            match = re.match(r"rfc(\d+)\.md", md_file.name)
+            match = RFC_MARKDOWN_FILE_PATTERN.match(md_file.name)
             if match:
                 rfc_number = int(match.group(1))
                 rfc_files.append((rfc_number, md_file))
@@ -223,7 +256,7 @@ def build_index_file(output_dir: Path) -> None:
         xml_file = output_dir / f"{rfc_name}.xml"
         if xml_file.exists():
             try:
-                tree = etree.parse(str(xml_file))
+                tree = etree.parse(str(xml_file), get_xml_parser())
                 root = tree.getroot()
                 front = root.find("front")
                 if front is not None:
@@ -238,23 +271,26 @@ def build_index_file(output_dir: Path) -> None:
             html_file = output_dir / f"{rfc_name}.html"
             if html_file.exists():
                 try:
-                    with open(html_file, encoding="utf-8") as f:
-                        html_content = f.read()
-                    soup = BeautifulSoup(html_content, "html.parser")
+                    soup = BeautifulSoup(
+                        html_file.read_bytes(),
+                        "lxml",
+                        from_encoding="utf-8",
+                        parse_only=HTML_TITLE_STRAINER,
+                    )
 
                     # Try to get title from <title> tag
                     title_tag = soup.find("title")
                     if title_tag and title_tag.string:
                         title = title_tag.string.strip()
                         # Remove "RFC XXXX - " prefix if present
-                        title = re.sub(r"^RFC\s*\d+\s*[-:]\s*", "", title, flags=re.IGNORECASE)
+                        title = RFC_TITLE_PREFIX_PATTERN.sub("", title)
 
                     # If no title tag, try first <h1>
                     if not title:
                         h1_tag = soup.find("h1")
                         if h1_tag:
                             title = h1_tag.get_text().strip()
-                            title = re.sub(r"^RFC\s*\d+\s*[-:]\s*", "", title, flags=re.IGNORECASE)
+                            title = RFC_TITLE_PREFIX_PATTERN.sub("", title)
                 except Exception as e:
                     logger.debug(f"Could not extract title from {html_file}: {e}")
 
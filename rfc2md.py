@@ -19,12 +19,11 @@ import logging
 import sys
 from pathlib import Path
 
-from lib import (
-    HtmlToMdConverter,
-    XmlToMdConverter,
+from lib.converter import XmlToMdConverter
+from lib.downloader import download_rfc, download_rfc_recursive
+from lib.html_converter import HtmlToMdConverter
+from lib.utils import (
     build_index_file,
-    download_rfc,
-    download_rfc_recursive,
     extract_rfc_numbers_from_markdown,
     normalize_rfc_number,
     setup_logging,
@@ -130,6 +129,28 @@ Examples:
     return args
 
 
+def write_xml_markdown(xml_file, output_file):
+    """
+    Convert an RFC XML file, streaming the Markdown into a file.
+
+    XmlToMdConverter.convert_to writes chunks as they are produced, so the
+    document is never held in memory as one string. The chunks go to a temporary
+    file that replaces output_file only once conversion succeeded, so a failed
+    conversion leaves no truncated Markdown file behind.
+
+    Args:
+        xml_file: Path to the RFC XML file
+        output_file: Path of the Markdown file to write
+    """
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            XmlToMdConverter(xml_file).convert_to(f)
+        tmp_file.replace(output_file)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+
+
 def main():
     """Main entry point for the RFC to Markdown converter."""
     args = parse_arguments()
@@ -222,14 +243,13 @@ def main():
                         logger.info(f"Using HTML converter for {rfc_num}")
                         converter = HtmlToMdConverter(primary_file)
                         markdown_content = converter.convert()
+
+                        # Write Markdown to file
+                        with open(output_file, "w", encoding="utf-8") as f:
+                            f.write(markdown_content)
                     else:
                         logger.info(f"Using XML converter for {rfc_num}")
-                        converter = XmlToMdConverter(primary_file)  # type: ignore[assignment]
-                        markdown_content = converter.convert()
-
-                    # Write Markdown to file
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(markdown_content)
+                        write_xml_markdown(primary_file, output_file)
 
                     logger.info(f"Successfully converted {rfc_num} to Markdown")
                     success_count += 1
@@ -287,14 +307,13 @@ def main():
                         logger.info("Detected HTML file, using HTML converter")
                         converter = HtmlToMdConverter(primary_file)
                         markdown_content = converter.convert()
+
+                        # Write Markdown to file
+                        with open(output_file, "w", encoding="utf-8") as f:
+                            f.write(markdown_content)
                     else:
                         logger.info("Using XML converter")
-                        converter = XmlToMdConverter(primary_file)  # type: ignore[assignment]
-                        markdown_content = converter.convert()
-
-                    # Write Markdown to file
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(markdown_content)
+                        write_xml_markdown(primary_file, output_file)
 
                     logger.info(f"Successfully converted to Markdown: {output_file}")
 
@@ -335,14 +354,13 @@ def main():
                 logger.info("Detected HTML file, using HTML converter")
                 converter = HtmlToMdConverter(xml_file)
                 markdown_content = converter.convert()
+
+                # Write Markdown to file
+                with open(output_file, "w", encoding="utf-8") as f:
+                    f.write(markdown_content)
             else:
                 logger.info("Using XML converter")
-                converter = XmlToMdConverter(xml_file)  # type: ignore[assignment]
-                markdown_content = converter.convert()
-
-            # Write Markdown to file
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(markdown_content)
+                write_xml_markdown(xml_file, output_file)
 
             logger.info(f"Successfully converted to Markdown: {output_file}")
 
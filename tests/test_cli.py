@@ -144,7 +144,7 @@ class TestMainWithRfc:
         mock_download.return_value = (xml_file, {})
         
         mock_conv_instance = Mock()
-        mock_conv_instance.convert.return_value = "# RFC 9514\n\nTest content"
+        mock_conv_instance.convert_to.side_effect = lambda f: f.write("# RFC 9514\n\nTest content")
         mock_converter.return_value = mock_conv_instance
         
         # Run main
@@ -207,7 +207,7 @@ class TestMainWithRfc:
         mock_download.return_value = (xml_file, {})
         
         mock_conv_instance = Mock()
-        mock_conv_instance.convert.return_value = "# RFC 9514"
+        mock_conv_instance.convert_to.side_effect = lambda f: f.write("# RFC 9514")
         mock_converter.return_value = mock_conv_instance
         
         # Run main
@@ -229,7 +229,7 @@ class TestMainWithRfc:
         mock_download.return_value = (xml_file, {})
         
         mock_conv_instance = Mock()
-        mock_conv_instance.convert.return_value = "# RFC 9514"
+        mock_conv_instance.convert_to.side_effect = lambda f: f.write("# RFC 9514")
         mock_converter.return_value = mock_conv_instance
         
         # Run main
@@ -263,7 +263,7 @@ class TestMainWithRecursive:
         }
         
         mock_conv_instance = Mock()
-        mock_conv_instance.convert.return_value = "# RFC"
+        mock_conv_instance.convert_to.side_effect = lambda f: f.write("# RFC")
         mock_converter.return_value = mock_conv_instance
         
         # Run main
@@ -303,7 +303,7 @@ class TestMainWithFile:
         
         # Setup mocks
         mock_conv_instance = Mock()
-        mock_conv_instance.convert.return_value = "# Test RFC"
+        mock_conv_instance.convert_to.side_effect = lambda f: f.write("# Test RFC")
         mock_converter.return_value = mock_conv_instance
         
         # Run main
@@ -311,7 +311,8 @@ class TestMainWithFile:
         
         # Verify
         mock_converter.assert_called_once_with(xml_file)
-        assert (tmp_path / "test.md").exists()
+        assert (tmp_path / "test.md").read_text(encoding="utf-8") == "# Test RFC"
+        assert not (tmp_path / "test.md.tmp").exists()
 
     @patch('rfc2md.HtmlToMdConverter')
     @patch('rfc2md.setup_logging')
@@ -363,6 +364,33 @@ class TestMainWithFile:
         assert exc_info.value.code == 1
 
 
+class TestWriteXmlMarkdown:
+    """Test streaming XML conversion output to a file."""
+
+    def test_write_xml_markdown_matches_convert(self, tmp_path):
+        """Test that the streamed file holds the same document as convert()."""
+        xml_file = Path(__file__).parent / "fixtures" / "xml" / "rfc9514.xml"
+        output_file = tmp_path / "rfc9514.md"
+
+        rfc2md.write_xml_markdown(xml_file, output_file)
+
+        assert output_file.read_text(encoding="utf-8") == rfc2md.XmlToMdConverter(xml_file).convert()
+        assert [p.name for p in tmp_path.iterdir()] == ["rfc9514.md"]
+
+    def test_write_xml_markdown_keeps_previous_output_on_error(self, tmp_path):
+        """Test that a failed conversion neither truncates the old output nor leaves a temp file."""
+        xml_file = tmp_path / "broken.xml"
+        xml_file.write_text("<rfc><front>")
+        output_file = tmp_path / "broken.md"
+        output_file.write_text("# Previous output", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            rfc2md.write_xml_markdown(xml_file, output_file)
+
+        assert output_file.read_text(encoding="utf-8") == "# Previous output"
+        assert not (tmp_path / "broken.md.tmp").exists()
+
+
 class TestMainWithFromMd:
     """Test main function with --from-md argument."""
 
@@ -391,7 +419,7 @@ class TestMainWithFromMd:
         ]
         
         mock_conv_instance = Mock()
-        mock_conv_instance.convert.return_value = "# RFC"
+        mock_conv_instance.convert_to.side_effect = lambda f: f.write("# RFC")
         mock_converter.return_value = mock_conv_instance
         
         # Run main
@@ -447,7 +475,7 @@ class TestMainDebugMode:
         mock_download.return_value = (xml_file, {})
         
         mock_conv_instance = Mock()
-        mock_conv_instance.convert.return_value = "# RFC 9514"
+        mock_conv_instance.convert_to.side_effect = lambda f: f.write("# RFC 9514")
         mock_converter.return_value = mock_conv_instance
         
         # Run main
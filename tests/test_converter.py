@@ -9,7 +9,14 @@ import pytest
 from pathlib import Path
 from lxml import etree
 
-from lib.converter import XmlToMdConverter
+from lib.converter import (
+    REFERENCE_DATE_FIELDS,
+    XmlToMdConverter,
+    anchor_tag,
+    find_first,
+    format_date,
+    indentation,
+)
 
 
 class TestXmlToMdConverterInit:
@@ -39,6 +46,11 @@ class TestXmlToMdConverterInit:
         
         assert converter.xml_file == Path(xml_file)
 
+    def test_instances_have_no_dict(self):
+        """Test that __slots__ keeps instances free of a per-instance __dict__."""
+        converter = XmlToMdConverter("test.xml")
+        assert not hasattr(converter, "__dict__")
+
 
 class TestXmlToMdConverterErrorHandling:
     """Test error handling in XmlToMdConverter."""
@@ -200,6 +212,33 @@ class TestProcessFront:
         assert "**IPR:** trust200902" in converter.markdown_lines
         assert "**Doc Name:** draft-test-01" in converter.markdown_lines
 
+    def test_process_front_keeps_output_order(self, tmp_path):
+        """Test that front output order does not depend on element order."""
+        xml_content = '''<?xml version="1.0"?>
+<rfc category="std">
+    <front>
+        <keyword>alpha</keyword>
+        <date month="May" year="2020"/>
+        <title>Test RFC</title>
+        <keyword>beta</keyword>
+    </front>
+</rfc>'''
+        xml_file = tmp_path / "test.xml"
+        xml_file.write_text(xml_content, encoding="utf-8")
+        
+        converter = XmlToMdConverter(xml_file)
+        converter.tree = etree.parse(str(xml_file))
+        converter.root = converter.tree.getroot()
+        converter._process_front()
+        
+        lines = [line for line in converter.markdown_lines if line]
+        assert lines == [
+            "# Test RFC",
+            "**Category:** std",
+            "**Date:** May 2020",
+            "**Keywords:** alpha, beta",
+        ]
+
     def test_process_front_with_authors(self, tmp_path):
         """Test processing front with author information."""
         xml_content = '''<?xml version="1.0"?>
@@ -608,4 +647,341 @@ class TestGetElementText:
         converter.root = converter.tree.getroot()
         converter._process_middle()
         
-        assert "Use `code` here." in converter.markdown_lines
\ No newline at end of file
+        assert "Use `code` here." in converter.markdown_lines
+
+
+class TestCommentsAndProcessingInstructions:
+    """Test that XML comments and processing instructions are not rendered."""
+
+    def test_comment_text_is_not_rendered(self, tmp_path):
+        """Test that comment and PI content stays out of paragraphs."""
+        xml_content = '''<?xml version="1.0"?>
+<rfc>
+    <middle>
+        <section>
+            <name>Test</name>
+            <t>Visible <!-- hidden note --> text<?rfc compact="yes"?> here.</t>
+        </section>
+    </middle>
+</rfc>'''
+        xml_file = tmp_path / "test.xml"
+        xml_file.write_text(xml_content, encoding="utf-8")
+
+        for markdown in (
+            XmlToMdConverter(xml_file).convert(),
+            "".join(XmlToMdConverter(xml_file).convert_streaming()),
+        ):
+            assert "Visible  text here." in markdown
+            assert "hidden note" not in markdown
+            assert "compact" not in markdown
+
+
+class TestElementTextCache:
+    """Test memoization of element text extraction."""
+
+    def test_nested_list_item_text_is_reused(self, tmp_path):
+        """Test that nested items computed via their parent are cached."""
+        root = etree.fromstring("<li>Outer<ul><li>Inner <em>x</em></li></ul></li>")
+        inner = root.find("ul/li")
+        converter = XmlToMdConverter(tmp_path / "test.xml")
+        
+        assert converter._get_element_text(root) == "OuterInner *x*"
+        assert converter._text_cache[inner] == "Inner *x*"
+        assert converter._get_element_text(inner) == "Inner *x*"
+
+    def test_cache_is_cleared_after_convert(self):
+        """Test that convert() does not keep element references alive."""
+        xml_file = Path(__file__).parent / "fixtures" / "xml" / "rfc9514.xml"
+        converter = XmlToMdConverter(xml_file)
+        converter.convert()
+        
+        assert converter._text_cache == {}
+
+    def test_leaf_text_is_stripped_and_not_cached(self, tmp_path):
+        """Test that leaf elements skip the join and the cache."""
+        leaf = etree.fromstring("<td>  cell  </td>")
+        converter = XmlToMdConverter(tmp_path / "test.xml")
+
+        assert converter._get_element_text(leaf) == "cell"
+        assert converter._get_element_text(etree.fromstring("<td/>")) == ""
+        assert converter._text_cache == {}
+
+
+class TestDefinitionList:
+    """Test definition list processing."""
+
+    def test_nested_figure_and_dl_are_indented(self, tmp_path):
+        """Test that figures and definition lists nested in dd are indented."""
+        xml_content = '''<?xml version="1.0"?>
+<rfc>
+    <middle>
+        <section>
+            <name>Test</name>
+            <dl>
+                <dt>Term</dt>
+                <dd>
+                    <t>Description</t>
+                    <figure><artwork>+--+</artwork></figure>
+                    <dl><dt>Inner</dt><dd>Inner text</dd></dl>
+                </dd>
+            </dl>
+        </section>
+    </middle>
+</rfc>'''
+        xml_file = tmp_path / "test.xml"
+        xml_file.write_text(xml_content, encoding="utf-8")
+        
+        converter = XmlToMdConverter(xml_file)
+        converter.tree = etree.parse(str(xml_file))
+        converter.root = converter.tree.getroot()
+        converter.markdown_lines.append("before")
+        converter._process_middle()
+        
+        assert converter.markdown_lines == [
+            "before",
+            "# Test",
+            "",
+            "**Term**",
+            "  Description",
+            "",
+            "  ```",
+            "  +--+",
+            "  ```",
+            "  **Inner**",
+            "    Inner text",
+            "",
+        ]
+
+
+class TestBlankLine:
+    """Test structural blank line emission."""
+
+    def test_blank_line_is_not_repeated(self, tmp_path):
+        """Test that consecutive separators collapse into one empty line."""
+        converter = XmlToMdConverter(tmp_path / "test.xml")
+        converter.markdown_lines.append("text")
+        converter._blank_line()
+        converter._blank_line()
+        
+        assert converter.markdown_lines == ["text", ""]
+
+    def test_blank_line_on_empty_output(self, tmp_path):
+        """Test that a separator is emitted when there is no output yet."""
+        converter = XmlToMdConverter(tmp_path / "test.xml")
+        converter._blank_line()
+        
+        assert converter.markdown_lines == [""]
+
+
+class TestConvertStreaming:
+    """Test incremental conversion with iterparse."""
+
+    @pytest.mark.parametrize("name", ["rfc9514", "rfc9552"])
+    def test_convert_streaming_matches_convert(self, name):
+        """Test that joined streaming output equals the regular conversion."""
+        xml_file = Path(__file__).parent / "fixtures" / "xml" / f"{name}.xml"
+        
+        expected = XmlToMdConverter(xml_file).convert()
+        chunks = list(XmlToMdConverter(xml_file).convert_streaming())
+        
+        assert len(chunks) > 1
+        assert "".join(chunks) == expected
+
+    @pytest.mark.parametrize(
+        "xml_content",
+        ["<rfc/>", "<rfc><front><title>Only Front</title></front></rfc>"],
+    )
+    def test_convert_streaming_matches_convert_without_sections(self, tmp_path, xml_content):
+        """Test documents without <middle> sections or <back> stream like convert()."""
+        xml_file = tmp_path / "minimal.xml"
+        xml_file.write_text(xml_content, encoding="utf-8")
+
+        expected = XmlToMdConverter(xml_file).convert()
+
+        assert "".join(XmlToMdConverter(xml_file).convert_streaming()) == expected
+
+    def test_convert_streaming_with_invalid_xml_syntax(self, tmp_path):
+        """Test streaming conversion with invalid XML syntax."""
+        xml_file = tmp_path / "invalid.xml"
+        xml_file.write_text('<?xml version="1.0"?><rfc><middle>', encoding="utf-8")
+        
+        converter = XmlToMdConverter(xml_file)
+        
+        with pytest.raises(ValueError, match="Invalid XML syntax"):
+            "".join(converter.convert_streaming())
+
+    def test_convert_streaming_with_nonexistent_file(self, tmp_path):
+        """Test streaming conversion with nonexistent file."""
+        converter = XmlToMdConverter(tmp_path / "nonexistent.xml")
+        
+        with pytest.raises(ValueError, match="Error parsing XML"):
+            "".join(converter.convert_streaming())
+
+    def test_convert_to_writes_document(self, tmp_path):
+        """Test that convert_to writes the same document as convert()."""
+        xml_file = Path(__file__).parent / "fixtures" / "xml" / "rfc9514.xml"
+        output_file = tmp_path / "rfc9514.md"
+
+        expected = XmlToMdConverter(xml_file).convert()
+        with open(output_file, "w", encoding="utf-8") as f:
+            written = XmlToMdConverter(xml_file).convert_to(f)
+
+        assert output_file.read_text(encoding="utf-8") == expected
+        assert written == len(expected)
+
+
+class TestContactDetails:
+    """Test author and contact address rendering."""
+
+    def test_author_and_contact_share_address_format(self, tmp_path):
+        """Test that authors and contacts render postal data the same way."""
+        xml_content = '''<?xml version="1.0"?>
+<rfc>
+    <back>
+        <section anchor="authors-addresses" numbered="false">
+            <name>Authors' Addresses</name>
+            <author fullname="Jane Doe">
+                <organization>Example Corp</organization>
+                <address>
+                    <postal>
+                        <country>US</country>
+                        <city>Springfield</city>
+                        <street>1 Main St</street>
+                    </postal>
+                    <email>jane@example.com</email>
+                </address>
+            </author>
+            <contact fullname="John Roe">
+                <address>
+                    <postal>
+                        <street>2 Side St</street>
+                        <code>12345</code>
+                    </postal>
+                </address>
+            </contact>
+        </section>
+    </back>
+</rfc>'''
+        xml_file = tmp_path / "test.xml"
+        xml_file.write_text(xml_content, encoding="utf-8")
+        
+        converter = XmlToMdConverter(xml_file)
+        converter.tree = etree.parse(str(xml_file))
+        converter.root = converter.tree.getroot()
+        converter._process_back()
+        
+        assert "- Organization: Example Corp" in converter.markdown_lines
+        assert "- Address: 1 Main St, Springfield, US" in converter.markdown_lines
+        assert "- Email: jane@example.com" in converter.markdown_lines
+        assert "**John Roe**" in converter.markdown_lines
+        assert "- Address: 2 Side St, 12345" in converter.markdown_lines
+
+
+class TestIndentation:
+    """Test indentation string lookup."""
+
+    def test_indentation_levels(self):
+        """Test that table lookups match two spaces per level."""
+        assert indentation(0) == ""
+        assert indentation(3) == "      "
+        assert indentation(40) == "  " * 40
+        assert indentation(-1) == ""
+
+
+class TestAnchorTag:
+    """Test HTML anchor span generation."""
+
+    def test_plain_anchor(self):
+        """Test that ordinary anchors are emitted unchanged."""
+        assert anchor_tag("section-1") == '<a name="section-1"></a>'
+
+    def test_anchor_is_escaped(self):
+        """Test that attribute-breaking characters are escaped."""
+        assert anchor_tag('a"b&c<d>') == '<a name="a&quot;b&amp;c&lt;d&gt;"></a>'
+
+    def test_anchor_is_cached(self):
+        """Test that repeated anchors return the cached string."""
+        assert anchor_tag("RFC8402") is anchor_tag("RFC8402")
+
+
+class TestFormatDate:
+    """Test <date> element formatting."""
+
+    def test_full_date(self):
+        """Test that day, month and year are joined in order."""
+        date_elem = etree.fromstring('<date year="2024" month="May" day="15"/>')
+        assert format_date(date_elem) == "15 May 2024"
+
+    def test_missing_parts_are_skipped(self):
+        """Test that absent or empty attributes leave no extra spaces."""
+        date_elem = etree.fromstring('<date month="" year="2024"/>')
+        assert format_date(date_elem) == "2024"
+
+    def test_reference_fields(self):
+        """Test that references omit the day."""
+        date_elem = etree.fromstring('<date year="2024" month="May" day="15"/>')
+        assert format_date(date_elem, REFERENCE_DATE_FIELDS) == "May 2024"
+
+    def test_no_date_element(self):
+        """Test that a missing element formats as an empty string."""
+        assert format_date(None) == ""
+
+
+class TestTable:
+    """Test table processing."""
+
+    def test_table_rows_are_padded_to_headers(self):
+        """Test headers from the first thead row and padding of short rows."""
+        table = etree.fromstring('''<table>
+    <name>Codes</name>
+    <thead><tr><th>Code</th><th>Meaning</th></tr><tr><th>ignored</th></tr></thead>
+    <tbody>
+        <tr><td>1</td><td><bcp14>MUST</bcp14> use</td></tr>
+        <tr><td>2</td></tr>
+    </tbody>
+</table>''')
+        converter = XmlToMdConverter("test.xml")
+
+        converter._process_table(table)
+
+        assert converter.markdown_lines == [
+            "**Table: Codes**",
+            "",
+            "| Code | Meaning |",
+            "| --- | --- |",
+            "| 1 | **MUST** use |",
+            "| 2 |  |",
+            "",
+        ]
+
+
+class TestFindFirst:
+    """Test first-child lookup by tag."""
+
+    def test_find_first_matches_find(self):
+        """Test that find_first returns the same element as find()."""
+        elem = etree.fromstring("<note><t>a</t><name>N</name><name>M</name></note>")
+        assert find_first(elem, "name") is elem.find("name")
+        assert find_first(elem, "figure") is None
+
+
+class TestNote:
+    """Test note processing."""
+
+    def test_note_lines_are_quoted(self):
+        """Test that note paragraphs become blockquote lines without blank lines."""
+        note = etree.fromstring("<note><name>Caution</name><t>first\n\n  second</t><t>third</t></note>")
+        converter = XmlToMdConverter("test.xml")
+
+        converter._process_note(note)
+
+        assert converter.markdown_lines == [
+            "> **Caution**",
+            ">",
+            "> first",
+            ">   second",
+            ">",
+            "> third",
+            ">",
+            "",
+        ]
@@ -7,15 +7,233 @@ This module tests RFC downloading functionality with mocked network requests.
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
+import json
 import requests
+import threading
 
-from lib.downloader import download_rfc_html, download_rfc, download_rfc_recursive
+from lib.downloader import (
+    DOWNLOAD_CHUNK_SIZE,
+    HTTP_POOL_SIZE,
+    _SESSION,
+    _save_response,
+    _stream_to_file,
+    download_rfc,
+    download_rfc_html,
+    download_rfc_recursive,
+)
+
+
+@pytest.fixture(autouse=True)
+def validator_cache(tmp_path_factory, monkeypatch):
+    """Keep the HTTP validator cache out of the user's cache directory."""
+    cache_file = tmp_path_factory.mktemp("cache") / "validators.json"
+    monkeypatch.setattr('lib.downloader.VALIDATOR_CACHE_FILE', cache_file)
+    return cache_file
+
+
+class TestSaveResponse:
+    """Test _save_response helper."""
+
+    def test_save_response_writes_all_chunks(self, tmp_path):
+        """Test that all chunks are written and the byte count is returned."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.iter_content = Mock(return_value=[b'<rfc>', b'', b'</rfc>'])
+        path = tmp_path / "rfc9514.xml"
+
+        assert _save_response(mock_response, path) == 11
+        assert path.read_bytes() == b'<rfc></rfc>'
+        mock_response.iter_content.assert_called_once_with(chunk_size=DOWNLOAD_CHUNK_SIZE)
+
+
+class TestStreamToFile:
+    """Test _stream_to_file helper."""
+
+    @patch('lib.downloader._SESSION.get')
+    def test_stream_to_file_returns_size(self, mock_get, tmp_path):
+        """Test that the body is saved and its size returned."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.iter_content = Mock(return_value=[b'%PDF'])
+        mock_get.return_value = mock_response
+        path = tmp_path / "rfc9514.pdf"
+
+        downloaded, elapsed = _stream_to_file("https://example.org/rfc9514.pdf", path)
+
+        assert downloaded == 4
+        assert elapsed >= 0
+        assert path.read_bytes() == b'%PDF'
+
+    @patch('lib.downloader._SESSION.get')
+    def test_stream_to_file_propagates_http_errors(self, mock_get, tmp_path):
+        """Test that HTTP errors are left to the caller."""
+        mock_response = Mock()
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+        mock_get.return_value = mock_response
+        path = tmp_path / "rfc9514.pdf"
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            _stream_to_file("https://example.org/rfc9514.pdf", path)
+        assert not path.exists()
+
+
+class TestConditionalDownload:
+    """Test ETag / Last-Modified revalidation of earlier downloads."""
+
+    XML_URL = "https://www.rfc-editor.org/rfc/rfc9514.xml"
+
+    @patch('lib.downloader._SESSION.get')
+    def test_validators_are_stored_and_replayed(self, mock_get, tmp_path, validator_cache):
+        """Test that a 200 stores validators and the next request sends them."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'ETag': '"abc"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+        mock_response.iter_content = Mock(return_value=[b'<html>v1</html>'])
+        mock_get.return_value = mock_response
+
+        download_rfc_html("rfc9514", tmp_path)
+        assert mock_get.call_args.kwargs['headers'] == {}
+
+        download_rfc_html("rfc9514", tmp_path)
+        assert mock_get.call_args.kwargs['headers'] == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT',
+        }
+
+        # Nothing but the downloaded file is left in the output directory
+        assert [p.name for p in tmp_path.iterdir()] == ["rfc9514.html"]
+        assert validator_cache.exists()
+
+    @patch('lib.downloader._SESSION.get')
+    def test_not_modified_reuses_existing_file(self, mock_get, tmp_path, validator_cache):
+        """Test that a 304 response keeps the previously downloaded file."""
+        xml_file = tmp_path / "rfc9514.xml"
+        xml_file.write_bytes(b'<rfc>cached</rfc>')
+        validator_cache.write_text(
+            json.dumps({self.XML_URL: {"path": str(xml_file.resolve()), "ETag": '"abc"'}}),
+            encoding="utf-8",
+        )
+
+        mock_response = Mock()
+        mock_response.status_code = 304
+        mock_get.return_value = mock_response
+
+        result = download_rfc("rfc9514", tmp_path)
+
+        assert result == (xml_file, {})
+        assert xml_file.read_bytes() == b'<rfc>cached</rfc>'
+        assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"abc"'}
+        mock_response.iter_content.assert_not_called()
+
+    @patch('lib.downloader._SESSION.get')
+    def test_validators_ignored_without_file(self, mock_get, tmp_path, validator_cache):
+        """Test that validators are not sent once the downloaded file is gone."""
+        xml_file = tmp_path / "rfc9514.xml"
+        validator_cache.write_text(
+            json.dumps({self.XML_URL: {"path": str(xml_file.resolve()), "ETag": '"abc"'}}),
+            encoding="utf-8",
+        )
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.iter_content = Mock(return_value=[b'<rfc/>'])
+        mock_get.return_value = mock_response
+
+        download_rfc("rfc9514", tmp_path)
+
+        assert mock_get.call_args.kwargs['headers'] == {}
+        assert xml_file.read_bytes() == b'<rfc/>'
+        # The stale entry is dropped since the new response has no validators
+        assert json.loads(validator_cache.read_text(encoding="utf-8")) == {}
+
+    @patch('lib.downloader._SESSION.get')
+    def test_validators_ignored_for_another_directory(self, mock_get, tmp_path, validator_cache):
+        """Test that validators stored for one output directory are not used for another."""
+        other_file = tmp_path / "other" / "rfc9514.xml"
+        other_file.parent.mkdir()
+        other_file.write_bytes(b'<rfc>other</rfc>')
+        (tmp_path / "rfc9514.xml").write_bytes(b'<rfc>old</rfc>')
+        validator_cache.write_text(
+            json.dumps({self.XML_URL: {"path": str(other_file.resolve()), "ETag": '"abc"'}}),
+            encoding="utf-8",
+        )
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.iter_content = Mock(return_value=[b'<rfc/>'])
+        mock_get.return_value = mock_response
+
+        download_rfc("rfc9514", tmp_path)
+
+        assert mock_get.call_args.kwargs['headers'] == {}
+
+    @patch('lib.downloader._save_validator_cache')
+    @patch('lib.downloader._load_validator_cache', return_value={})
+    @patch('lib.downloader._SESSION.get')
+    def test_download_rfc_reads_and_writes_cache_once(self, mock_get, mock_load, mock_save, tmp_path):
+        """Test that all formats of one download_rfc call share a single cache load and save."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'ETag': '"abc"'}
+        mock_response.iter_content = Mock(return_value=[b'data'])
+        mock_get.return_value = mock_response
+
+        download_rfc("rfc9514", tmp_path, extra_formats=["pdf", "text"])
+
+        assert mock_get.call_count == 3
+        mock_load.assert_called_once()
+        mock_save.assert_called_once()
+        assert set(mock_save.call_args.args[0]) == {
+            "https://www.rfc-editor.org/rfc/rfc9514.xml",
+            "https://www.rfc-editor.org/rfc/rfc9514.pdf",
+            "https://www.rfc-editor.org/rfc/rfc9514.txt",
+        }
+
+    @patch('lib.downloader._save_validator_cache')
+    @patch('lib.downloader.extract_rfc_references_from_xml')
+    @patch('lib.downloader.download_rfc')
+    def test_download_rfc_recursive_shares_one_cache(self, mock_download, mock_extract, mock_save, tmp_path):
+        """Test that a recursive run hands one cache to every download and saves it once."""
+        def download(rfc_number, *args):
+            path = tmp_path / f"{rfc_number}.xml"
+            path.write_text("<?xml?>")
+            return (path, {})
+
+        mock_download.side_effect = download
+        mock_extract.side_effect = lambda path: {"rfc2119", "rfc8174"} if path.stem == "rfc9514" else set()
+
+        download_rfc_recursive("rfc9514", tmp_path, max_depth=1)
+
+        assert mock_download.call_count == 3
+        caches = [call.args[5] for call in mock_download.call_args_list]
+        assert all(cache is caches[0] for cache in caches)
+        mock_save.assert_called_once_with(caches[0])
+
+
+class TestSession:
+    """Test the shared HTTP session."""
+
+    def test_https_adapter_pools_and_retries(self):
+        """Test that https:// uses a pooled adapter with gateway-error retries."""
+        adapter = _SESSION.get_adapter("https://www.rfc-editor.org/rfc/rfc9514.xml")
+
+        assert adapter._pool_maxsize == HTTP_POOL_SIZE
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+
+    def test_session_requests_gzip(self):
+        """Test that downloads ask for gzip-compressed bodies."""
+        assert "gzip" in _SESSION.headers["Accept-Encoding"]
 
 
 class TestDownloadRfcHtml:
     """Test download_rfc_html function."""
 
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_html_success(self, mock_get, tmp_path):
         """Test successful HTML download."""
         # Setup mock response
@@ -34,7 +252,7 @@ class TestDownloadRfcHtml:
         assert result.read_bytes() == b'<html>test</html>'
         mock_get.assert_called_once()
 
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_html_with_progress(self, mock_get, tmp_path):
         """Test HTML download with progress tracking."""
         mock_response = Mock()
@@ -48,7 +266,7 @@ class TestDownloadRfcHtml:
         assert result is not None
         assert result.exists()
 
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_html_404_error(self, mock_get, tmp_path):
         """Test HTML download with 404 error."""
         mock_response = Mock()
@@ -60,7 +278,7 @@ class TestDownloadRfcHtml:
         
         assert result is None
 
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_html_connection_error(self, mock_get, tmp_path):
         """Test HTML download with connection error."""
         mock_get.side_effect = requests.exceptions.ConnectionError("Network error")
@@ -69,7 +287,7 @@ class TestDownloadRfcHtml:
         
         assert result is None
 
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_html_timeout(self, mock_get, tmp_path):
         """Test HTML download with timeout."""
         mock_get.side_effect = requests.exceptions.Timeout("Request timeout")
@@ -78,7 +296,7 @@ class TestDownloadRfcHtml:
         
         assert result is None
 
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_html_request_exception(self, mock_get, tmp_path):
         """Test HTML download with generic request exception."""
         mock_get.side_effect = requests.exceptions.RequestException("Generic error")
@@ -87,7 +305,7 @@ class TestDownloadRfcHtml:
         
         assert result is None
 
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_html_os_error(self, mock_get, tmp_path):
         """Test HTML download with file write error."""
         mock_response = Mock()
@@ -106,7 +324,7 @@ class TestDownloadRfcHtml:
 class TestDownloadRfc:
     """Test download_rfc function."""
 
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_xml_success(self, mock_get, tmp_path):
         """Test successful XML download."""
         mock_response = Mock()
@@ -124,7 +342,7 @@ class TestDownloadRfc:
         assert extra_files == {}
 
     @patch('lib.downloader.download_rfc_html')
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_fallback_to_html(self, mock_get, mock_download_html, tmp_path):
         """Test fallback to HTML when XML not found."""
         # Mock XML 404 error
@@ -146,7 +364,7 @@ class TestDownloadRfc:
         mock_download_html.assert_called_once()
 
     @patch('lib.downloader.download_rfc_html')
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_xml_and_html_both_fail(self, mock_get, mock_download_html, tmp_path):
         """Test when both XML and HTML downloads fail."""
         # Mock XML 404 error
@@ -162,7 +380,7 @@ class TestDownloadRfc:
         
         assert result is None
 
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_with_pdf_extra_format(self, mock_get, tmp_path):
         """Test downloading with PDF extra format."""
         # Mock XML download
@@ -188,7 +406,7 @@ class TestDownloadRfc:
         assert extra_files["pdf"] == tmp_path / "rfc9514.pdf"
         assert extra_files["pdf"].exists()
 
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_with_pdf_fallback_url(self, mock_get, tmp_path):
         """Test PDF download with fallback URL."""
         # Mock XML download
@@ -217,7 +435,7 @@ class TestDownloadRfc:
         assert "pdf" in extra_files
         assert extra_files["pdf"].exists()
 
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_with_text_extra_format(self, mock_get, tmp_path):
         """Test downloading with text extra format."""
         # Mock XML download
@@ -242,7 +460,7 @@ class TestDownloadRfc:
         assert extra_files["text"] == tmp_path / "rfc9514.txt"
         assert extra_files["text"].exists()
 
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_with_xml_extra_format(self, mock_get, tmp_path):
         """Test downloading with xml extra format (already primary)."""
         mock_response = Mock()
@@ -259,7 +477,7 @@ class TestDownloadRfc:
         assert extra_files["xml"] == primary_file
 
     @patch('lib.downloader.download_rfc_html')
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_with_html_extra_format_when_html_primary(self, mock_get, mock_download_html, tmp_path):
         """Test downloading with html extra format when HTML is primary file."""
         # Mock XML 404 to trigger HTML fallback
@@ -280,7 +498,7 @@ class TestDownloadRfc:
         assert extra_files["html"] == primary_file
 
     @patch('lib.downloader.download_rfc_html')
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_with_html_extra_format_when_xml_primary(self, mock_get, mock_download_html, tmp_path):
         """Test downloading with html extra format when XML is primary file."""
         # Mock XML download success
@@ -304,7 +522,7 @@ class TestDownloadRfc:
         assert extra_files["html"] == html_file
         mock_download_html.assert_called_once()
 
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_connection_error(self, mock_get, tmp_path):
         """Test download with connection error."""
         mock_get.side_effect = requests.exceptions.ConnectionError("Network error")
@@ -313,7 +531,7 @@ class TestDownloadRfc:
         
         assert result is None
 
-    @patch('lib.downloader.requests.get')
+    @patch('lib.downloader._SESSION.get')
     def test_download_rfc_timeout(self, mock_get, tmp_path):
         """Test download with timeout."""
         mock_get.side_effect = requests.exceptions.Timeout("Request timeout")
@@ -500,4 +718,53 @@ class TestDownloadRfcRecursive:
         assert len(result) == 3
         assert "rfc9514" in result
         assert "rfc2119" in result
-        assert "rfc8174" in result
\ No newline at end of file
+        assert "rfc8174" in result
+
+    @patch('lib.downloader.download_rfc')
+    @patch('lib.downloader.extract_rfc_references_from_xml')
+    def test_download_rfc_recursive_downloads_siblings_concurrently(self, mock_extract, mock_download, tmp_path):
+        """Test that references at the same depth are downloaded in parallel."""
+        root = tmp_path / "rfc9514.xml"
+        root.write_text("<?xml?>")
+        barrier = threading.Barrier(2, timeout=5)
+
+        def download(rfc_number, *args):
+            # Both sibling downloads must be in flight for the barrier to open
+            barrier.wait()
+            path = tmp_path / f"{rfc_number}.xml"
+            path.write_text("<?xml?>")
+            return (path, {})
+
+        mock_download.side_effect = download
+        mock_extract.return_value = {"rfc2119", "rfc8174"}
+
+        result = download_rfc_recursive("rfc9514", tmp_path, max_depth=1)
+
+        assert set(result) == {"rfc9514", "rfc2119", "rfc8174"}
+        assert mock_download.call_count == 2
+
+    @patch('lib.downloader.download_rfc')
+    @patch('lib.downloader.extract_rfc_references_from_xml')
+    def test_download_rfc_recursive_shared_reference_downloaded_once(self, mock_extract, mock_download, tmp_path):
+        """Test that an RFC referenced by several siblings is fetched once."""
+        for name in ("rfc9514", "rfc2119", "rfc8174"):
+            (tmp_path / f"{name}.xml").write_text("<?xml?>")
+
+        def download(rfc_number, *args):
+            path = tmp_path / f"{rfc_number}.xml"
+            path.write_text("<?xml?>")
+            return (path, {})
+
+        references = {
+            "rfc9514": {"rfc2119", "rfc8174"},
+            "rfc2119": {"rfc7942"},
+            "rfc8174": {"rfc7942", "rfc9514"},
+        }
+        mock_download.side_effect = download
+        mock_extract.side_effect = lambda path: references.get(path.stem, set())
+
+        result = download_rfc_recursive("rfc9514", tmp_path, max_depth=2)
+
+        assert set(result) == {"rfc9514", "rfc2119", "rfc8174", "rfc7942"}
+        mock_download.assert_called_once()
+        assert mock_download.call_args.args[0] == "rfc7942"
@@ -2,6 +2,8 @@
 Tests for HTML to Markdown converter.
 """
 
+import pytest
+
 from lib.html_converter import HtmlToMdConverter
 
 
@@ -16,9 +18,14 @@ class TestHtmlConverter:
         """Test converter initialization."""
         converter = HtmlToMdConverter("test.html")
         assert converter.html_file.name == "test.html"
-        assert converter.soup is None
+        assert converter.tree is None
         assert converter.markdown_lines == []
 
+    def test_instances_have_no_dict(self):
+        """Test that __slots__ keeps instances free of a per-instance __dict__."""
+        converter = HtmlToMdConverter("test.html")
+        assert not hasattr(converter, "__dict__")
+
 
 class TestPageBreakRemoval:
     """Tests for page break removal functionality."""
@@ -33,7 +40,7 @@ More content
 RFC 7752                  BGP-LS                        March 2016
 Final content"""
 
-        result = converter._remove_page_breaks(text)
+        result = "\n".join(converter._remove_page_breaks(text.split("\n")))
 
         # Page header and footer should be removed
         assert "Standards Track" not in result
@@ -53,31 +60,33 @@ Final content"""
 
 Second paragraph starts here."""
 
-        result = converter._remove_page_breaks(text)
+        result = "\n".join(converter._remove_page_breaks(text.split("\n")))
 
         # Empty line should be preserved
         assert "\n\n" in result or result.count("\n") >= 2
 
 
-class TestLinkRemoval:
-    """Tests for HTML link removal."""
+class TestLinkText:
+    """Tests for link text in extracted <pre> content."""
 
-    def test_remove_links(self):
-        """Test that HTML links are removed while preserving text."""
-        converter = HtmlToMdConverter("dummy.html")
+    def test_link_markup_dropped_and_literal_tags_kept(self, tmp_path):
+        """Test that rendered links lose their markup but literal tag text in the RFC survives."""
+        html_file = tmp_path / "rfc9999.html"
+        html_file.write_text(
+            '<html><body><pre>See <a href="#section-1">Section 1</a> and '
+            '<a href="/rfc/rfc2119">RFC 2119</a>.\n'
+            'Example: &lt;a href="x"&gt;text&lt;/a&gt;</pre></body></html>',
+            encoding="utf-8",
+        )
 
-        text = 'This is <a href="#section-1">Section 1</a> and <a href="http://example.com">example</a>.'
+        result = HtmlToMdConverter(html_file).convert()
 
-        result = converter._remove_links(text)
+        # Link markup is gone, link text is preserved
+        assert "section-1" not in result
+        assert "See Section 1 and RFC 2119." in result
 
-        # Links should be removed
-        assert "<a" not in result
-        assert "</a>" not in result
-        assert "href" not in result
-
-        # Text should be preserved
-        assert "Section 1" in result
-        assert "example" in result
+        # Escaped markup quoted by the RFC itself is content, not a link
+        assert 'Example: <a href="x">text</a>' in result
 
 
 class TestEmptyLineCollapse:
@@ -98,7 +107,7 @@ Second paragraph.
 
 Third paragraph."""
 
-        result = converter._collapse_empty_lines(text)
+        result = "\n".join(converter._collapse_empty_lines(text.split("\n")))
 
         # Should not have triple newlines
         assert "\n\n\n" not in result
@@ -106,6 +115,15 @@ Third paragraph."""
         # Should still have double newlines (single empty line)
         assert "\n\n" in result
 
+    def test_collapse_empty_lines_at_edges(self):
+        """Test that runs at the start and end keep up to two empty lines."""
+        converter = HtmlToMdConverter("dummy.html")
+        lines = ["", "", "", "Text", "", "", "More", "", "", ""]
+
+        result = converter._collapse_empty_lines(lines)
+
+        assert result == ["", "", "Text", "", "More", "", ""]
+
 
 class TestTocExtraction:
     """Tests for Table of Contents extraction and formatting."""
@@ -126,7 +144,8 @@ Table of Contents
 
    This is the introduction text."""
 
-        result, formatted_toc, toc_start = converter._extract_toc(text)
+        result, formatted_toc, toc_start = converter._extract_toc(text.split("\n"))
+        result = "\n".join(result)
 
         # TOC should be found
         assert toc_start >= 0
@@ -177,7 +196,7 @@ class TestSectionProcessing:
 
    This is background text."""
 
-        result = converter._process_sections(text, 2)
+        result = converter._process_sections(text.split("\n"), 2)
 
         # Should contain section anchors
         assert "section-1" in result or "<a id=" in result
@@ -471,6 +490,19 @@ Status of This Memo
         assert "This is the abstract." in result
         assert "This is the status." in result
 
+    @pytest.mark.parametrize("html_content", ["", "  \n\t\n"])
+    def test_convert_blank_file(self, tmp_path, html_content):
+        """Test that an empty or whitespace-only file converts like a page without <pre> blocks."""
+        html_file = tmp_path / "blank.html"
+        html_file.write_text(html_content)
+        empty_page = tmp_path / "empty_page.html"
+        empty_page.write_text("<html></html>")
+
+        result = HtmlToMdConverter(html_file).convert()
+
+        assert result == HtmlToMdConverter(empty_page).convert()
+        assert result == "```text\n\n```\n"
+
 
 class TestTocWithContentsHeader:
     """Tests for TOC extraction with 'Contents' header (RFC3209 format)."""
@@ -487,7 +519,8 @@ Contents
 
 1. Introduction
 """
-        result, formatted_toc, toc_start = converter._extract_toc(text)
+        result, formatted_toc, toc_start = converter._extract_toc(text.split("\n"))
+        result = "\n".join(result)
 
         assert toc_start == 2  # Line where "Contents" appears
         assert "`Contents`" in formatted_toc
@@ -506,7 +539,8 @@ Table of Contents
 
 1. Introduction
 """
-        result, formatted_toc, toc_start = converter._extract_toc(text)
+        result, formatted_toc, toc_start = converter._extract_toc(text.split("\n"))
+        result = "\n".join(result)
 
         assert toc_start == 2
         assert "`Table of Contents`" in formatted_toc
@@ -525,7 +559,7 @@ Narten & Alvestrand      Best Current Practice                  [Page 1]
 
 Some text after"""
 
-        result = converter._remove_page_breaks(text)
+        result = "\n".join(converter._remove_page_breaks(text.split("\n")))
 
         # Page break should be completely removed
         assert "[Page 1]" not in result
@@ -543,7 +577,7 @@ Seedorf & Burger             Informational                      [Page 2]
 
 Content after"""
 
-        result = converter._remove_page_breaks(text)
+        result = "\n".join(converter._remove_page_breaks(text.split("\n")))
 
         assert "[Page 2]" not in result
         assert "Informational" not in result
@@ -563,7 +597,7 @@ Author Name              Category                               [Page 2]
 
 Section 3"""
 
-        result = converter._remove_page_breaks(text)
+        result = "\n".join(converter._remove_page_breaks(text.split("\n")))
 
         assert "[Page 1]" not in result
         assert "[Page 2]" not in result
@@ -586,7 +620,7 @@ Brown                    Experimental                           [Page 100]
 
 Text 3"""
 
-        result = converter._remove_page_breaks(text)
+        result = "\n".join(converter._remove_page_breaks(text.split("\n")))
 
         assert "[Page 10]" not in result
         assert "[Page 100]" not in result
@@ -602,7 +636,7 @@ Author                   Status                                 [Page 5]
 
 More content that mentions Page 5 in the text."""
 
-        result = converter._remove_page_breaks(text)
+        result = "\n".join(converter._remove_page_breaks(text.split("\n")))
 
         # Page break line should be removed
         assert "Author                   Status" not in result
@@ -610,12 +644,29 @@ More content that mentions Page 5 in the text."""
         assert "[Page numbers]" in result
         assert "Page 5 in the text" in result
 
+    def test_remove_page_breaks_keeps_indented_lines(self):
+        """Test that long indented lines (author blocks, ASCII art) are kept."""
+        converter = HtmlToMdConverter("dummy.html")
+        text = "\n".join(
+            [
+                " " * 67 + "T. Li",
+                "     |" + " " * 63 + "|",
+                "RFC 8402 is referenced here.",
+                " - ",
+                "-----",
+            ]
+        )
+
+        result = "\n".join(converter._remove_page_breaks(text.split("\n")))
+
+        assert result.split("\n") == text.split("\n")[:4]
+
     def test_remove_page_breaks_empty_text(self):
         """Test page break removal with empty text."""
         converter = HtmlToMdConverter("dummy.html")
         text = ""
 
-        result = converter._remove_page_breaks(text)
+        result = "\n".join(converter._remove_page_breaks(text.split("\n")))
 
         assert result == ""
 
@@ -626,7 +677,7 @@ More content that mentions Page 5 in the text."""
 with multiple lines
 but no page breaks."""
 
-        result = converter._remove_page_breaks(text)
+        result = "\n".join(converter._remove_page_breaks(text.split("\n")))
 
         assert result == text
 
@@ -645,7 +696,7 @@ Farrel, et al.               Informational                      [Page 1]
 
 1. Introduction"""
 
-        result = converter._remove_page_breaks(text)
+        result = "\n".join(converter._remove_page_breaks(text.split("\n")))
 
         # Page break should be removed
         assert "[Page 1]" not in result
@@ -665,7 +716,7 @@ Farrel, et al.               Informational                      [Page 1]
 
 Content after"""
 
-        result = converter._remove_page_breaks(text)
+        result = "\n".join(converter._remove_page_breaks(text.split("\n")))
 
         assert "[Page 1]" not in result
         assert "Farrel, et al." not in result
@@ -691,7 +742,7 @@ Author Name              {category:40}[Page {i}]
 
 Text after"""
 
-            result = converter._remove_page_breaks(text)
+            result = "\n".join(converter._remove_page_breaks(text.split("\n")))
 
             assert f"[Page {i}]" not in result
             assert category not in result
@@ -128,6 +128,26 @@ def test_build_index_file_with_html_sources():
         assert "[RFC 8402](rfc8402.md): Segment Routing Architecture" in content
 
 
+def test_build_index_file_with_html_h1_fallback():
+    """Test index generation falls back to the first <h1> without a <title>."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output_dir = Path(tmpdir)
+
+        (output_dir / "rfc8402.md").write_text("# RFC 8402\n\nContent")
+        html_8402 = """<html>
+<body>
+    <pre>RFC 8402 text</pre>
+    <h1>RFC 8402: <span>Segment Routing</span> Architecture</h1>
+</body>
+</html>"""
+        (output_dir / "rfc8402.html").write_text(html_8402)
+
+        build_index_file(output_dir)
+
+        content = (output_dir / "index.md").read_text()
+        assert "[RFC 8402](rfc8402.md): Segment Routing Architecture" in content
+
+
 def test_build_index_file_sorting():
     """Test that RFCs are sorted numerically, not lexicographically."""
     with tempfile.TemporaryDirectory() as tmpdir:
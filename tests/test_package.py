@@ -0,0 +1,60 @@
+"""
+Unit tests for the lib package façade.
+
+This module tests the lazy re-export of public names from lib/__init__.py.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import lib
+
+
+class TestLazyExports:
+    """Test lazy loading of public names."""
+
+    def test_all_names_resolve(self):
+        """Test that every name in __all__ resolves to an object."""
+        for name in lib.__all__:
+            assert getattr(lib, name) is not None
+
+    def test_resolved_name_matches_submodule(self):
+        """Test that lazily resolved names are the submodule objects."""
+        from lib.converter import XmlToMdConverter
+
+        assert lib.XmlToMdConverter is XmlToMdConverter
+
+    def test_resolved_name_is_cached(self):
+        """Test that a resolved name is stored in the module dict."""
+        lib.HtmlToMdConverter  # noqa: B018
+
+        assert "HtmlToMdConverter" in vars(lib)
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="no_such_name"):
+            lib.no_such_name  # noqa: B018
+
+    def test_dir_lists_public_names(self):
+        """Test that dir() includes names that are not loaded yet."""
+        assert set(lib.__all__) <= set(dir(lib))
+
+    def test_import_does_not_load_submodules(self):
+        """Test that importing the package does not import the converters."""
+        code = (
+            "import sys, lib; "
+            "print(any(m in sys.modules for m in "
+            "('lib.converter', 'lib.html_converter', 'lib.downloader')))"
+        )
+        # Run from the repository root so "import lib" resolves wherever pytest starts
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parents[1],
+        )
+        assert result.stdout.strip() == "False"
@@ -3,6 +3,7 @@
 import tempfile
 from pathlib import Path
 
+from lib.converter import XmlToMdConverter
 from lib.utils import (
     extract_rfc_numbers_from_markdown,
     extract_rfc_references_from_html,
@@ -119,6 +120,16 @@ class TestExtractRfcReferences:
         finally:
             temp_file.unlink()
 
+    def test_extract_from_parsed_tree(self):
+        """Test that an already parsed tree gives the same references as the path."""
+        xml_file = Path("examples/rfc9514.xml")
+        converter = XmlToMdConverter(xml_file)
+        converter.convert()
+
+        assert extract_rfc_references_from_xml(converter.tree) == extract_rfc_references_from_xml(
+            xml_file
+        )
+
     def test_extract_from_nonexistent_file(self):
         """Test extraction from non-existent file."""
         xml_file = Path("nonexistent_file.xml")
@@ -201,6 +212,25 @@ class TestExtractRfcReferencesFromHtml:
         finally:
             temp_file.unlink()
 
+    def test_extract_from_relative_links_split_across_lines(self):
+        """Test extraction of references whose link text wraps between "RFC" and the number."""
+        html_content = """
+        <html><body><pre>
+   Postel, J., "Internet Protocol", STD 5, <a href="./rfc791">RFC</a>
+                         <a href="./rfc791">791</a>, September 1981.
+        </pre></body></html>
+        """
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
+            f.write(html_content)
+            temp_file = Path(f.name)
+
+        try:
+            refs = extract_rfc_references_from_html(temp_file)
+            assert refs == {"rfc791"}
+        finally:
+            temp_file.unlink()
+
     def test_extract_returns_set(self):
         """Test that function returns a set."""
         html_content = "<html><body>RFC 1234</body></html>"